@@ -1,5 +1,18 @@
 from __future__ import annotations
+from functools import lru_cache
+from operator import itemgetter
 from babel.core import get_global
+_OFFICIAL_STATUSES: dict[tuple[bool, bool], frozenset[str]] = {
+    (False, False): frozenset({'official'}),
+    (True, False): frozenset({'official', 'official_regional'}),
+    (False, True): frozenset({'official', 'de_facto_official'}),
+    (True, True): frozenset({'official', 'official_regional', 'de_facto_official'}),
+}
+
+@lru_cache(maxsize=None)
+def _territory_languages(territory: str) -> dict[str, dict[str, float | str]]:
+    """Return the (immutable) CLDR language data for `territory`."""
+    return get_global('territory_languages').get(territory, {})
 
 def get_official_languages(territory: str, regional: bool=False, de_facto: bool=False) -> tuple[str, ...]:
     """
@@ -23,18 +36,15 @@ def get_official_languages(territory: str, regional: bool=False, de_facto: bool=
     :return: Tuple of language codes
     :rtype: tuple[str]
     """
-    from babel.core import get_global
-
-    territory_languages = get_global('territory_languages').get(territory, {})
-    official_languages = []
-
-    for lang, data in territory_languages.items():
-        if 'official_status' in data:
-            status = data['official_status']
-            if status == 'official' or (regional and status == 'official_regional') or (de_facto and status == 'de_facto_official'):
-                official_languages.append(lang)
-
-    return tuple(sorted(official_languages, key=lambda x: territory_languages[x].get('population_percent', 0), reverse=True))
+    allowed_statuses = _OFFICIAL_STATUSES[bool(regional), bool(de_facto)]
+    pairs = [
+        (-data.get('population_percent', 0), lang)
+        for lang, data in _territory_languages(territory).items()
+        if data.get('official_status') in allowed_statuses
+    ]
+    # Sort on the population only; the sort is stable, so ties keep CLDR order.
+    pairs.sort(key=itemgetter(0))
+    return tuple(lang for _, lang in pairs)
 
 def get_territory_language_info(territory: str) -> dict[str, dict[str, float | str | None]]:
     """
@@ -61,9 +71,7 @@ def get_territory_language_info(territory: str) -> dict[str, dict[str, float | s
     :return: Language information dictionary
     :rtype: dict[str, dict]
     """
-    from babel.core import get_global
-
-    territory_languages = get_global('territory_languages').get(territory, {})
+    territory_languages = _territory_languages(territory)
     result = {}
 
     for lang, data in territory_languages.items():
@@ -75,3 +83,35 @@ def get_territory_language_info(territory: str) -> dict[str, dict[str, float | s
         result[lang] = lang_info
 
     return result
+
+@lru_cache(maxsize=None)
+def get_territory_language_arrays(territory: str) -> tuple[tuple[str, ...], tuple[float, ...], tuple[str | None, ...]]:
+    """
+    Get the language information for a territory as parallel sequences.
+
+    This holds the same data as :func:`get_territory_language_info`, laid out as
+    three tuples of equal length instead of one dictionary per language: the
+    language codes, their population percentages (``0.0`` where unknown) and their
+    official status (``None`` where there is none).  This layout is convenient for
+    ranking or aggregating the data, or for converting it into e.g. NumPy arrays.
+
+    >>> codes, population_percents, official_statuses = get_territory_language_arrays('CH')
+    >>> codes[:3]
+    ('de', 'gsw', 'en')
+    >>> official_statuses[:3]
+    ('official', 'de_facto_official', None)
+
+    .. warning:: Note that the data is as up to date as the current version of the CLDR used
+                 by Babel.  If you need scientifically accurate information, use another source!
+
+    :param territory: Territory code
+    :type territory: str
+    :return: Tuple of language codes, population percentages and official statuses
+    :rtype: tuple[tuple[str], tuple[float], tuple[str|None]]
+    """
+    territory_languages = _territory_languages(territory)
+    return (
+        tuple(territory_languages),
+        tuple(float(data.get('population_percent', 0)) for data in territory_languages.values()),
+        tuple(data.get('official_status') for data in territory_languages.values()),
+    )
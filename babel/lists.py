@@ -14,7 +14,9 @@
     :license: BSD, see LICENSE for more details.
 """
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from string import Formatter
 from typing import TYPE_CHECKING
 from babel.core import Locale, default_locale
 if TYPE_CHECKING:
@@ -65,20 +67,65 @@ def format_list(lst: Sequence[str], style: Literal['standard', 'standard-short',
     """
     if not lst:
         return ""
-    
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-    elif locale is None:
-        locale = Locale.parse(DEFAULT_LOCALE)
-
-    list_patterns = locale.list_patterns.get(style, locale.list_patterns['standard'])
-    
-    if len(lst) == 1:
+    elif len(lst) == 1:
         return lst[0]
-    elif len(lst) == 2:
-        return list_patterns['2'].format(lst[0], lst[1])
-    
-    result = list_patterns['start'].format(lst[0], lst[1])
-    for item in lst[2:-1]:
-        result = list_patterns['middle'].format(result, item)
-    return list_patterns['end'].format(result, lst[-1])
+
+    if locale is None:
+        locale = DEFAULT_LOCALE
+    formatters, middle_parts = _resolve_list_patterns(locale, style)
+
+    if len(lst) == 2:
+        return formatters['2'](lst[0], lst[1])
+
+    result = formatters['start'](lst[0], lst[1])
+    if len(lst) > 3:
+        if middle_parts is None:
+            middle = formatters['middle']
+            for item in lst[2:-1]:
+                result = middle(result, item)
+        else:
+            # Apply the middle pattern to all items in one go rather than
+            # re-copying the growing result string for every item.
+            prefix, infix, suffix = middle_parts
+            if prefix or suffix:
+                result = ''.join([prefix * (len(lst) - 3), result, *(f'{infix}{item}{suffix}' for item in lst[2:-1])])
+            else:
+                result = infix.join([result, *lst[2:-1]])
+    return formatters['end'](result, lst[-1])
+
+@lru_cache(maxsize=256)
+def _resolve_list_patterns(locale: Locale | str, style: str) -> tuple[dict[str, Callable[[str, str], str]], tuple[str, str, str] | None]:
+    """Return the list patterns of `style` for `locale`, compiled into
+    two-argument formatting functions, along with the literal parts of the
+    ``middle`` pattern as split by `_split_list_pattern`.
+
+    Styles the locale does not define fall back to ``standard``.
+    """
+    list_patterns = Locale.parse(locale).list_patterns
+    patterns = list_patterns.get(style, list_patterns['standard'])
+    formatters = {key: _compile_list_pattern(pattern) for key, pattern in patterns.items()}
+    return formatters, _split_list_pattern(patterns.get('middle', ''))
+
+def _split_list_pattern(pattern: str) -> tuple[str, str, str] | None:
+    """Split a ``<prefix>{0}<infix>{1}<suffix>`` list pattern into its literal
+    parts, or return `None` if the pattern has any other shape.
+    """
+    parsed = list(Formatter().parse(pattern))
+    if [(field, spec, conversion) for _, field, spec, conversion in parsed[:2]] != [('0', '', None), ('1', '', None)]:
+        return None
+    suffix = ''
+    if len(parsed) == 3 and parsed[2][1] is None:
+        suffix = parsed[2][0]
+    elif len(parsed) != 2:
+        return None
+    return parsed[0][0], parsed[1][0], suffix
+
+def _compile_list_pattern(pattern: str) -> Callable[[str, str], str]:
+    """Compile a list pattern into a function applying it to two items, so
+    the pattern string does not have to be re-parsed on every use.
+    """
+    parts = _split_list_pattern(pattern)
+    if parts is None:
+        return pattern.format
+    prefix, infix, suffix = parts
+    return lambda first, second: f'{prefix}{first}{infix}{second}{suffix}'
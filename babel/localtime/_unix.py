@@ -1,6 +1,7 @@
 import datetime
+import errno
 import os
-import re
+from functools import lru_cache
 from babel.localtime._helpers import _get_tzinfo, _get_tzinfo_from_file, _get_tzinfo_or_raise
 
 def _get_localzone(_root: str='/') -> datetime.tzinfo:
@@ -16,25 +17,49 @@ def _get_localzone(_root: str='/') -> datetime.tzinfo:
     tzenv = os.environ.get('TZ')
     if tzenv:
         return _get_tzinfo_or_raise(tzenv)
+    return _get_localzone_from_files(_root)
+
+@lru_cache(maxsize=8)
+def _get_localzone_from_files(_root: str) -> datetime.tzinfo:
+    """Find the local timezone from the configuration files beneath `_root`.
+
+    The system configuration is not expected to change while the process
+    runs, so the result is cached; tests that modify the files under a
+    `_root` should call ``_get_localzone_from_files.cache_clear()``.
+    """
+    # Check for /etc/localtime symlink; a single readlink() is the cheapest
+    # lookup on systemd-style systems, so it goes before /etc/timezone.
+    # Its errors also tell whether /etc/localtime exists at all, which
+    # saves separate stat calls.
+    localtime_path = os.path.join(_root, 'etc/localtime')
+    try:
+        link_target = os.readlink(localtime_path)
+    except OSError as e:
+        # ENOENT is the only error that means there is no such path; EINVAL
+        # for instance is raised when it exists but is not a symlink
+        localtime_exists = e.errno != errno.ENOENT
+    else:
+        _, sep, tzname = link_target.partition('/zoneinfo/')
+        if sep and tzname:
+            # Links like .../zoneinfo/posix/Europe/Berlin or to custom zone
+            # files need not name a known zone; fall through to the others
+            tzinfo = _get_tzinfo(tzname)
+            if tzinfo is not None:
+                return tzinfo
+        localtime_exists = os.path.exists(localtime_path)
 
     # Check for /etc/timezone file
-    timezone_file = os.path.join(_root, 'etc/timezone')
-    if os.path.isfile(timezone_file):
-        with open(timezone_file, 'r') as f:
+    try:
+        with open(os.path.join(_root, 'etc/timezone')) as f:
             tzname = f.read().strip()
+    except OSError:
+        pass
+    else:
         if tzname:
             return _get_tzinfo_or_raise(tzname)
 
-    # Check for /etc/localtime symlink
-    localtime_path = os.path.join(_root, 'etc/localtime')
-    if os.path.islink(localtime_path):
-        link_target = os.readlink(localtime_path)
-        match = re.search(r'/zoneinfo/([^/]+/[^/]+)$', link_target)
-        if match:
-            return _get_tzinfo_or_raise(match.group(1))
-
     # If all else fails, use /etc/localtime file
-    if os.path.exists(localtime_path):
+    if localtime_exists:
         return _get_tzinfo_from_file(localtime_path)
 
     # If we can't determine the timezone, raise an exception
@@ -11,12 +11,6 @@ except RuntimeError:
 
 def valuestodict(key) -> dict[str, Any]:
     """Convert a registry key's values to a dictionary."""
-    result = {}
+    enum_value = winreg.EnumValue
     size = winreg.QueryInfoKey(key)[1]
-    for i in range(size):
-        try:
-            name, value, type = winreg.EnumValue(key, i)
-            result[name] = value
-        except WindowsError:
-            break
-    return result
+    return {name: value for name, value, _type in (enum_value(key, i) for i in range(size))}
@@ -21,7 +21,7 @@ from babel import __version__ as VERSION
 from babel.core import Locale, UnknownLocaleError
 from babel.dates import format_datetime
 from babel.messages.plurals import get_plural
-from babel.util import LOCALTZ, FixedOffsetTimezone, _cmp, distinct
+from babel.util import LOCALTZ, FixedOffsetTimezone, _cmp
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
     _MessageID: TypeAlias = str | tuple[str, ...] | list[str]
@@ -77,14 +77,14 @@ class Message:
         if not string and self.pluralizable:
             string = ('', '')
         self.string = string
-        self.locations = list(distinct(locations))
+        self.locations = list(dict.fromkeys(locations))
         self.flags = set(flags)
         if id and self.python_format:
             self.flags.add('python-format')
         else:
             self.flags.discard('python-format')
-        self.auto_comments = list(distinct(auto_comments))
-        self.user_comments = list(distinct(user_comments))
+        self.auto_comments = list(dict.fromkeys(auto_comments))
+        self.user_comments = list(dict.fromkeys(user_comments))
         if isinstance(previous_id, str):
             self.previous_id = [previous_id]
         else:
@@ -207,6 +207,27 @@ class Message:
             return any('%' in id_part for id_part in self.id)
         return '%' in self.id
 
+    @property
+    def python_format_placeholders(self) -> tuple[tuple[tuple[str | None, str], ...], ...]:
+        """The ``(name, type)`` pairs of the Python-style parameters in each
+        form of the message ID, parsed once and cached until the ID changes.
+
+        >>> Message('foo %(name)s bar').python_format_placeholders
+        ((('name', 's'),),)
+        >>> Message(('%d foo', '%d foos')).python_format_placeholders
+        (((None, 'd'),), ((None, 'd'),))
+
+        :type: `tuple`"""
+        cached = self.__dict__.get('_python_format_placeholders')
+        if cached is None or cached[0] is not self.id:
+            ids = self.id if isinstance(self.id, (list, tuple)) else (self.id,)
+            placeholders = tuple(
+                tuple((m.group(1), m.group(3)) for m in PYTHON_FORMAT.finditer(id_part))
+                for id_part in ids
+            )
+            cached = self._python_format_placeholders = (self.id, placeholders)
+        return cached[1]
+
 class TranslationError(Exception):
     """Exception thrown by translation checkers when invalid message
     translations are encountered."""
@@ -387,9 +408,9 @@ class Catalog:
             if message.pluralizable and (not current.pluralizable):
                 current.id = message.id
                 current.string = message.string
-            current.locations = list(distinct(current.locations + message.locations))
-            current.auto_comments = list(distinct(current.auto_comments + message.auto_comments))
-            current.user_comments = list(distinct(current.user_comments + message.user_comments))
+            current.locations = list(dict.fromkeys(current.locations + message.locations))
+            current.auto_comments = list(dict.fromkeys(current.auto_comments + message.auto_comments))
+            current.user_comments = list(dict.fromkeys(current.user_comments + message.user_comments))
             current.flags |= message.flags
             message = current
         elif id == '':
@@ -10,9 +10,18 @@
     :license: BSD, see LICENSE for more details.
 """
 from __future__ import annotations
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from babel.messages.catalog import PYTHON_FORMAT, Catalog, Message, TranslationError
 _string_format_compatibilities = [{'i', 'd', 'u'}, {'x', 'X'}, {'f', 'F', 'g', 'G'}]
+#: Indexed by the code point of a type character, holds one bit for each of
+#: the compatibility sets the character belongs to.  Characters without any
+#: bits set are only compatible with themselves.
+_TYPE_MASKS = bytearray(128)
+for _bit, _compat_set in enumerate(_string_format_compatibilities):
+    for _type in _compat_set:
+        _TYPE_MASKS[ord(_type)] |= 1 << _bit
+del _bit, _compat_set, _type
 
 def num_plurals(catalog: Catalog | None, message: Message) -> None:
     """Verify the number of plurals in the translation."""
@@ -25,10 +34,54 @@ def num_plurals(catalog: Catalog | None, message: Message) -> None:
 
 def python_format(catalog: Catalog | None, message: Message) -> None:
     """Verify the format string placeholders in the translation."""
-    if 'python-format' in message.flags:
-        _validate_format(message.id, message.string)
-
-def _validate_format(format: str, alternative: str) -> None:
+    if 'python-format' not in message.flags:
+        return
+    msgid = message.id
+    msgstrs = message.string
+    placeholders = message.python_format_placeholders
+    if not isinstance(msgid, (list, tuple)):
+        if msgstrs:
+            _validate_format(msgid, msgstrs, placeholders[0])
+        return
+    if not isinstance(msgstrs, (list, tuple)):
+        msgstrs = (msgstrs,)
+    # The first form is checked against the singular msgid, all other plural
+    # forms against the plural msgid.
+    for idx, msgstr in enumerate(msgstrs):
+        if msgstr:
+            form = 0 if idx == 0 else 1
+            _validate_format(msgid[form], msgstr, placeholders[form])
+
+def validate_catalog(catalog: Catalog) -> Iterator[tuple[Message, list[TranslationError]]]:
+    """Run the `num_plurals` and `python_format` checks on all messages of
+    `catalog` in a single pass.
+
+    For every message which fails validation, a ``(message, errors)`` tuple is
+    yielded, where ``errors`` is a list of `TranslationError` objects.  This
+    gives the same results as calling both checkers on every message, but
+    resolves the number of plurals of the catalog only once.
+
+    :param catalog: the catalog to validate
+    """
+    expected_plurals = catalog.num_plurals
+    for message in catalog._messages.values():
+        errors = []
+        string = message.string
+        if expected_plurals:
+            if isinstance(string, (list, tuple)):
+                if len(string) != expected_plurals:
+                    errors.append(TranslationError(f"Expected {expected_plurals} plurals, got {len(string)}"))
+            elif message.pluralizable:
+                errors.append(TranslationError(f"Expected {expected_plurals} plurals, got a single string"))
+        if 'python-format' in message.flags:
+            try:
+                python_format(catalog, message)
+            except TranslationError as e:
+                errors.append(e)
+        if errors:
+            yield message, errors
+
+def _validate_format(format: str, alternative: str, format_parts: tuple[tuple[str | None, str], ...] | None=None) -> None:
     """Test format string `alternative` against `format`.  `format` can be the
     msgid of a message and `alternative` one of the `msgstr`\\s.  The two
     arguments are not interchangeable as `alternative` may contain less
@@ -57,30 +110,39 @@ def _validate_format(format: str, alternative: str) -> None:
     :param format: The original format string
     :param alternative: The alternative format string that should be checked
                         against format
+    :param format_parts: The placeholders of `format`, as parsed by
+                         `_parse_format` or `Message.python_format_placeholders`,
+                         if already known
     :raises TranslationError: on formatting errors
     """
-    def parse_format(s):
-        return [(m.group(1), m.group(3)) for m in PYTHON_FORMAT.finditer(s)]
+    if '%' not in format and '%' not in alternative:
+        # Neither string can contain placeholders
+        return
+    if format_parts is None:
+        format_parts = _parse_format(format)
+    alternative_parts = _parse_format(alternative)
+
+    if not _are_compatible(format_parts, alternative_parts):
+        raise TranslationError('The format strings are incompatible')
+
+@lru_cache(maxsize=4096)
+def _parse_format(string: str) -> tuple[tuple[str | None, str], ...]:
+    """Return the ``(name, typechar)`` pairs of the placeholders in `string`.
 
-    def are_compatible(a, b):
-        if not a and not b:
-            return True
-        if len(a) != len(b):
+    Results are cached, as the same msgid is checked against every plural
+    form of its translation, and again whenever a catalog is re-validated.
+    """
+    return tuple((m.group(1), m.group(3)) for m in PYTHON_FORMAT.finditer(string))
+
+def _are_compatible(a: tuple[tuple[str | None, str], ...], b: tuple[tuple[str | None, str], ...]) -> bool:
+    """Whether the placeholders `a` and `b` (as returned by `_parse_format`)
+    have the same names and compatible types, pairwise."""
+    if len(a) != len(b):
+        return False
+    for (a_name, a_type), (b_name, b_type) in zip(a, b):
+        if a_name != b_name:
             return False
-        for (a_name, a_type), (b_name, b_type) in zip(a, b):
-            if a_name != b_name:
-                return False
-            if a_type != b_type:
-                for compat_set in _string_format_compatibilities:
-                    if a_type in compat_set and b_type in compat_set:
-                        break
-                else:
-                    return False
-        return True
-
-    format_parts = parse_format(format)
-    alternative_parts = parse_format(alternative)
-
-    if not are_compatible(format_parts, alternative_parts):
-        raise TranslationError('The format strings are incompatible')
+        if a_type != b_type and not _TYPE_MASKS[ord(a_type)] & _TYPE_MASKS[ord(b_type)]:
+            return False
+    return True
 checkers: list[Callable[[Catalog | None, Message], object]] = _find_checkers()
@@ -22,11 +22,14 @@ import os
 import sys
 import tokenize
 from collections.abc import Callable, Collection, Generator, Iterable, Mapping, MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
 from os.path import relpath
 from textwrap import dedent
 from tokenize import COMMENT, NAME, OP, STRING, generate_tokens
 from typing import TYPE_CHECKING, Any
-from babel.util import parse_encoding, parse_future_flags, pathmatch
+from babel.util import parse_encoding, pathmatch
 if TYPE_CHECKING:
     from typing import IO, Protocol
     from _typeshed import SupportsItems, SupportsRead, SupportsReadline
@@ -55,6 +58,8 @@ DEFAULT_MAPPING: list[tuple[str, str]] = [('**.py', 'python')]
 FSTRING_START = getattr(tokenize, 'FSTRING_START', None)
 FSTRING_MIDDLE = getattr(tokenize, 'FSTRING_MIDDLE', None)
 FSTRING_END = getattr(tokenize, 'FSTRING_END', None)
+#: Below this many files, `extract_from_dir` does not start a process pool.
+_MIN_PARALLEL_JOBS = 8
 
 def _strip_comment_tags(comments: MutableSequence[str], tags: Iterable[str]):
     """Helper function for `extract` that strips comment tags from strings
@@ -66,7 +71,7 @@ def _strip_comment_tags(comments: MutableSequence[str], tags: Iterable[str]):
                 comments[i] = comment[len(tag):].strip()
                 break
 
-def extract_from_dir(dirname: str | os.PathLike[str] | None=None, method_map: Iterable[tuple[str, str]]=DEFAULT_MAPPING, options_map: SupportsItems[str, dict[str, Any]] | None=None, keywords: Mapping[str, _Keyword]=DEFAULT_KEYWORDS, comment_tags: Collection[str]=(), callback: Callable[[str, str, dict[str, Any]], object] | None=None, strip_comment_tags: bool=False, directory_filter: Callable[[str], bool] | None=None) -> Generator[_FileExtractionResult, None, None]:
+def extract_from_dir(dirname: str | os.PathLike[str] | None=None, method_map: Iterable[tuple[str, str]]=DEFAULT_MAPPING, options_map: SupportsItems[str, dict[str, Any]] | None=None, keywords: Mapping[str, _Keyword]=DEFAULT_KEYWORDS, comment_tags: Collection[str]=(), callback: Callable[[str, str, dict[str, Any]], object] | None=None, strip_comment_tags: bool=False, directory_filter: Callable[[str], bool] | None=None, max_workers: int | None=1) -> Generator[_FileExtractionResult, None, None]:
     """Extract messages from any source files found in the given directory.
 
     This function generates tuples of the form ``(filename, lineno, message,
@@ -134,6 +139,13 @@ def extract_from_dir(dirname: str | os.PathLike[str] | None=None, method_map: It
     :param directory_filter: a callback to determine whether a directory should
                              be recursed into. Receives the full directory path;
                              should return True if the directory is valid.
+                             Defaults to `default_directory_filter`.
+    :param max_workers: the number of processes to extract files in.  With the
+                        default of 1, files are extracted one after the other
+                        in the current process; `None` uses one process per
+                        CPU.  When extracting in parallel, `callback` is called
+                        for all files before any extraction starts, and the
+                        extraction methods and options must be picklable.
     :see: `pathmatch`
     """
     if dirname is None:
@@ -141,17 +153,151 @@ def extract_from_dir(dirname: str | os.PathLike[str] | None=None, method_map: It
     
     if options_map is None:
         options_map = {}
-    
-    for root, dirnames, filenames in os.walk(dirname):
-        if directory_filter and not directory_filter(root):
+
+    # Files matching the same option patterns share their options
+    options_cache = {}
+    suffixes = _method_map_suffixes(method_map)
+    if max_workers == 1:
+        for filepath, rel_filepath in _walk_files(dirname, directory_filter, suffixes):
+            match = _find_extraction_method(rel_filepath, method_map, options_map, options_cache)
+            if match is None:
+                continue
+            method, options = match
+            if callback:
+                callback(rel_filepath, method, options)
+            for message_tuple in extract_from_file(
+                method, filepath, keywords=keywords,
+                comment_tags=comment_tags, options=options,
+                strip_comment_tags=strip_comment_tags,
+            ):
+                yield (rel_filepath, *message_tuple)
+        return
+
+    # Find all files to extract first, then extract them in a process pool
+    jobs = []
+    rel_filepaths = []
+    for filepath, rel_filepath in _walk_files(dirname, directory_filter, suffixes):
+        match = _find_extraction_method(rel_filepath, method_map, options_map, options_cache)
+        if match is None:
             continue
-        
-        for filename in filenames:
-            filepath = os.path.join(root, filename)
-            yield from check_and_call_extract_file(
-                filepath, method_map, options_map, callback,
-                keywords, comment_tags, strip_comment_tags, dirname
-            )
+        method, options = match
+        if callback:
+            callback(rel_filepath, method, options)
+        jobs.append((method, filepath, options))
+        rel_filepaths.append(rel_filepath)
+
+    extract_job = partial(_extract_job, keywords=keywords, comment_tags=comment_tags, strip_comment_tags=strip_comment_tags)
+    executor = None
+    if len(jobs) < _MIN_PARALLEL_JOBS:
+        results = map(extract_job, jobs)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(extract_job, jobs, chunksize=max(1, len(jobs) // (4 * workers)))
+    try:
+        for rel_filepath, messages in zip(rel_filepaths, results):
+            for message_tuple in messages:
+                yield (rel_filepath, *message_tuple)
+    finally:
+        if executor is not None:
+            # Drop the queued jobs rather than wait for them if the caller
+            # stopped consuming early (`cancel_futures` is new in Python 3.9)
+            if sys.version_info >= (3, 9):
+                executor.shutdown(cancel_futures=True)
+            else:
+                executor.shutdown()
+
+def default_directory_filter(dirpath: str | os.PathLike[str]) -> bool:
+    """The directory filter `extract_from_dir` uses if none is given: skips
+    directories whose name starts with a dot or an underscore (such as ``.git``
+    or ``__pycache__``).
+    """
+    return not os.path.basename(dirpath).startswith(('.', '_'))
+
+def _walk_files(dirname: str | os.PathLike[str], directory_filter: Callable[[str], bool] | None, suffixes: tuple[str, ...] | None=None) -> Generator[tuple[str, str], None, None]:
+    """Yield ``(filepath, rel_filepath)`` for all files beneath `dirname`,
+    without descending into directories rejected by `directory_filter`.
+    If `suffixes` are given, only files whose name ends with one of them
+    are yielded.
+
+    Like `os.walk`, the files of a directory come before those of its
+    subdirectories, and symbolic links to directories are not followed.
+    Files and directories are visited in sorted order.
+    """
+    if directory_filter is None:
+        directory_filter = default_directory_filter
+    yield from _scan_dir(os.fspath(dirname), '', directory_filter, suffixes)
+
+def _scan_dir(path: str, rel_path: str, directory_filter: Callable[[str], bool], suffixes: tuple[str, ...] | None) -> Generator[tuple[str, str], None, None]:
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    if suffixes is None or entry.name.endswith(suffixes):
+                        files.append(entry)
+                elif directory_filter(entry.path) and not entry.is_symlink():
+                    subdirs.append(entry)
+    except OSError:
+        # Unreadable directories are skipped, as `os.walk` does by default
+        return
+    files.sort(key=attrgetter('name'))
+    subdirs.sort(key=attrgetter('name'))
+    for entry in files:
+        yield entry.path, os.path.join(rel_path, entry.name) if rel_path else entry.name
+    for entry in subdirs:
+        yield from _scan_dir(entry.path, os.path.join(rel_path, entry.name) if rel_path else entry.name, directory_filter, suffixes)
+
+def _method_map_suffixes(method_map: Iterable[tuple[str, str]]) -> tuple[str, ...] | None:
+    """If all patterns of `method_map` only select files by their ending,
+    like ``**.py``, return these endings, otherwise `None`.
+
+    Files with other endings cannot match any pattern, so `extract_from_dir`
+    skips them while walking the directory.
+    """
+    suffixes = []
+    for pattern, _method in method_map:
+        suffix = pattern[2:]
+        if not pattern.startswith('**') or not suffix or any(char in suffix for char in '*?/' + os.path.sep):
+            return None
+        suffixes.append(suffix)
+    return tuple(suffixes) or None
+
+def _extract_job(job: tuple[_ExtractionMethod, str, dict[str, Any]], keywords: Mapping[str, _Keyword], comment_tags: Collection[str], strip_comment_tags: bool) -> list[_ExtractionResult]:
+    """Run `extract_from_file` for a ``(method, filepath, options)`` job of
+    `extract_from_dir`; this needs to be a module-level function so it can be
+    sent to worker processes.
+    """
+    method, filepath, options = job
+    return extract_from_file(method, filepath, keywords, comment_tags, options, strip_comment_tags)
+
+def _find_extraction_method(rel_filepath: str, method_map: Iterable[tuple[str, str]], options_map: SupportsItems[str, dict[str, Any]], options_cache: dict[tuple[str, ...], dict[str, Any]] | None=None) -> tuple[str, dict[str, Any]] | None:
+    """Return the extraction method and the options for the file at
+    `rel_filepath` according to the mappings, or `None` if no method matches.
+
+    If an `options_cache` dictionary is given, the options merged for the
+    patterns of the `options_map` a file matches are kept there and reused
+    for other files matching the same patterns; every file still gets its own
+    copy of them.
+    """
+    for pattern, method in method_map:
+        if pathmatch(pattern, rel_filepath):
+            matched = [(opt_pattern, opt_dict) for opt_pattern, opt_dict in options_map.items() if pathmatch(opt_pattern, rel_filepath)]
+            key = tuple(opt_pattern for opt_pattern, _ in matched)
+            options = options_cache.get(key) if options_cache is not None else None
+            if options is None:
+                options = {}
+                for _, opt_dict in matched:
+                    options.update(opt_dict)
+                if options_cache is not None:
+                    options_cache[key] = options
+            return method, dict(options)
+    return None
 
 def check_and_call_extract_file(filepath: str | os.PathLike[str], method_map: Iterable[tuple[str, str]], options_map: SupportsItems[str, dict[str, Any]], callback: Callable[[str, str, dict[str, Any]], object] | None, keywords: Mapping[str, _Keyword], comment_tags: Collection[str], strip_comment_tags: bool, dirpath: str | os.PathLike[str] | None=None) -> Generator[_FileExtractionResult, None, None]:
     """Checks if the given file matches an extraction method mapping, and if so, calls extract_from_file.
@@ -186,24 +332,22 @@ def check_and_call_extract_file(filepath: str | os.PathLike[str], method_map: It
     if dirpath is None:
         dirpath = os.getcwd()
     
-    rel_filepath = os.path.relpath(filepath, dirpath)
-    
-    for pattern, method in method_map:
-        if pathmatch(pattern, rel_filepath):
-            options = {}
-            for opt_pattern, opt_dict in options_map.items():
-                if pathmatch(opt_pattern, rel_filepath):
-                    options.update(opt_dict)
-            
-            if callback:
-                callback(rel_filepath, method, options)
-            
-            yield from extract_from_file(
-                method, filepath, keywords=keywords,
-                comment_tags=comment_tags, options=options,
-                strip_comment_tags=strip_comment_tags
-            )
-            break
+    rel_filepath = relpath(filepath, dirpath)
+
+    match = _find_extraction_method(rel_filepath, method_map, options_map)
+    if match is None:
+        return
+    method, options = match
+
+    if callback:
+        callback(rel_filepath, method, options)
+
+    for message_tuple in extract_from_file(
+        method, filepath, keywords=keywords,
+        comment_tags=comment_tags, options=options,
+        strip_comment_tags=strip_comment_tags
+    ):
+        yield (rel_filepath, *message_tuple)
 
 def extract_from_file(method: _ExtractionMethod, filename: str | os.PathLike[str], keywords: Mapping[str, _Keyword]=DEFAULT_KEYWORDS, comment_tags: Collection[str]=(), options: Mapping[str, Any] | None=None, strip_comment_tags: bool=False) -> list[_ExtractionResult]:
     """Extract messages from a specific file.
@@ -267,7 +411,111 @@ def extract(method: _ExtractionMethod, fileobj: _FileObj, keywords: Mapping[str,
     :returns: iterable of tuples of the form ``(lineno, message, comments, context)``
     :rtype: Iterable[tuple[int, str|tuple[str], list[str], str|None]
     """
-    pass
+    func = None
+    if callable(method):
+        func = method
+    elif ':' in method or '.' in method:
+        if ':' not in method:
+            lastdot = method.rfind('.')
+            module, attrname = method[:lastdot], method[lastdot + 1:]
+        else:
+            module, attrname = method.split(':', 1)
+        func = getattr(__import__(module, {}, {}, [attrname]), attrname)
+    else:
+        try:
+            from pkg_resources import working_set
+        except ImportError:
+            pass
+        else:
+            for entry_point in working_set.iter_entry_points(GROUP_NAME, method):
+                func = entry_point.load(require=True)
+                break
+        if func is None:
+            # if pkg_resources is not available or no usable egg-info was found
+            # (see #230), we resort to looking up the builtin extractors
+            # directly
+            builtin = {
+                'ignore': extract_nothing,
+                'python': extract_python,
+                'javascript': extract_javascript,
+            }
+            func = builtin.get(method)
+
+    if func is None:
+        raise ValueError(f"Unknown extraction method {method!r}")
+
+    results = func(fileobj, keywords.keys(), comment_tags, options=options or {})
+
+    for lineno, funcname, messages, comments in results:
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+        if not messages:
+            continue
+
+        specs = keywords[funcname] or None if funcname else None
+        # {None: x} may be collapsed into x for backwards compatibility.
+        if not isinstance(specs, dict):
+            specs = {None: specs}
+
+        if strip_comment_tags:
+            _strip_comment_tags(comments, comment_tags)
+
+        # None matches all arities.
+        for arity in (None, len(messages)):
+            try:
+                spec = specs[arity]
+            except KeyError:
+                continue
+            if spec is None:
+                spec = (1,)
+            result = _match_messages_against_spec(lineno, messages, comments, fileobj, spec)
+            if result is not None:
+                yield result
+
+def _match_messages_against_spec(lineno: int, messages: list[str | None], comments: list[str], fileobj: _FileObj, spec: tuple[int | tuple[int, str], ...]) -> _ExtractionResult | None:
+    """Pick the message, plural forms and context out of the arguments of a
+    keyword call, as selected by its keyword `spec`.
+
+    Returns `None` if the call does not have the arguments the spec asks for,
+    or if its msgid is empty.
+    """
+    translatable = []
+    context = None
+
+    # last_index is 1 based like the keyword spec
+    last_index = len(messages)
+    for index in spec:
+        if isinstance(index, tuple):  # (n, 'c')
+            context = messages[index[0] - 1]
+            continue
+        if last_index < index:
+            # Not enough arguments
+            return None
+        message = messages[index - 1]
+        if message is None:
+            return None
+        translatable.append(message)
+
+    # keyword spec indexes are 1 based, therefore '-1'
+    if isinstance(spec[0], tuple):
+        # context-aware *gettext method
+        first_msg_index = spec[1] - 1
+    else:
+        first_msg_index = spec[0] - 1
+    # An empty string msgid isn't valid, emit a warning
+    if not messages[first_msg_index]:
+        filename = (getattr(fileobj, "name", None) or "(unknown)")
+        sys.stderr.write(
+            f"{filename}:{lineno}: warning: Empty msgid.  It is reserved by GNU gettext: gettext(\"\") "
+            f"returns the header entry with meta information, not the empty string.\n",
+        )
+        return None
+
+    translatable = tuple(translatable)
+    if len(translatable) == 1:
+        translatable = translatable[0]
+
+    return lineno, translatable, comments, context
 
 def extract_nothing(fileobj: _FileObj, keywords: Mapping[str, _Keyword], comment_tags: Collection[str], options: Mapping[str, Any]) -> list[_ExtractionResult]:
     """Pseudo extractor that does not actually extract anything, but simply
@@ -290,65 +538,151 @@ def extract_python(fileobj: IO[bytes], keywords: Mapping[str, _Keyword], comment
     :param options: a dictionary of additional options (optional)
     :rtype: ``iterator``
     """
-    encoding = options.get('encoding', 'utf-8')
-    future_flags = parse_future_flags(fileobj, encoding)
-    
-    fileobj.seek(0)
-    reader = io.TextIOWrapper(fileobj, encoding=encoding)
-    
-    try:
-        tree = ast.parse(reader.read(), filename=getattr(fileobj, 'name', '<unknown>'))
-    except SyntaxError as e:
-        raise ValueError(f'Unable to parse python file {getattr(fileobj, "name", "<unknown>")}: {e}')
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            func_name = None
-            if isinstance(node.func, ast.Name):
-                func_name = node.func.id
-            elif isinstance(node.func, ast.Attribute):
-                func_name = node.func.attr
-            
-            if func_name in keywords:
-                keyword = keywords[func_name]
-                if isinstance(keyword, dict):
-                    specs = keyword.get(len(node.args))
+    funcname = lineno = message_lineno = None
+    call_stack = -1
+    buf = []
+    messages = []
+    translator_comments = []
+    in_def = in_translator_comments = False
+    # str.startswith checks all the tags in one call, and keywords may be
+    # given as any collection of names
+    comment_tags = tuple(comment_tags)
+    keyword_names = frozenset(keywords)
+
+    encoding = parse_encoding(fileobj) or options.get('encoding', 'UTF-8')
+    # Decode the whole file at once, rather than line by line as the
+    # tokenizer asks for them
+    source = fileobj.read().decode(encoding)
+
+    tokens = generate_tokens(io.StringIO(source).readline)
+
+    # Current prefix of a Python 3.12 (PEP 701) f-string, or None if we're not
+    # currently parsing one.
+    current_fstring_start = None
+
+    for tok, value, (lineno, _), _, _ in tokens:
+        if call_stack == -1 and tok == NAME and value in ('def', 'class'):
+            in_def = True
+        elif tok == OP and value == '(':
+            if in_def:
+                # Avoid false positives for declarations such as:
+                # def gettext(arg='message'):
+                in_def = False
+                continue
+            if funcname:
+                message_lineno = lineno
+                call_stack += 1
+        elif in_def and tok == OP and value == ':':
+            # End of a class definition without parens
+            in_def = False
+            continue
+        elif call_stack == -1 and tok == COMMENT:
+            # Strip the comment token from the line
+            value = value[1:].strip()
+            if in_translator_comments and \
+                    translator_comments[-1][0] == lineno - 1:
+                # We're already inside a translator comment, continue appending
+                translator_comments.append((lineno, value))
+                continue
+            # If execution reaches this point, let's see if comment line
+            # starts with one of the comment tags
+            if value.startswith(comment_tags):
+                in_translator_comments = True
+                translator_comments.append((lineno, value))
+        elif funcname and call_stack == 0:
+            nested = (tok == NAME and value in keyword_names)
+            if (tok == OP and value == ')') or nested:
+                if buf:
+                    messages.append(''.join(buf))
+                    del buf[:]
                 else:
-                    specs = keyword
-                
-                if specs:
-                    messages = []
-                    for spec in specs:
-                        if isinstance(spec, int):
-                            if spec < len(node.args):
-                                arg = node.args[spec]
-                                if isinstance(arg, ast.Str):
-                                    messages.append(arg.s)
-                        elif isinstance(spec, tuple):
-                            context = None
-                            if len(spec) == 2 and spec[1] == 'c':
-                                context = node.args[spec[0]]
-                                if isinstance(context, ast.Str):
-                                    context = context.s
-                    
-                    if messages:
-                        comments = extract_comments(node)
-                        for comment_tag in comment_tags:
-                            if comment_tag in comments:
-                                comments = [c for c in comments if c.startswith(comment_tag)]
-                                break
-                        
-                        if len(messages) > 1:
-                            yield node.lineno, tuple(messages), comments, context
-                        else:
-                            yield node.lineno, messages[0], comments, context
-
-def extract_comments(node):
-    comments = []
-    for n in ast.iter_child_nodes(node):
-        if isinstance(n, ast.Expr) and isinstance(n.value, ast.Str):
-            comments.append(n.value.s)
-    return comments
+                    messages.append(None)
+
+                messages = tuple(messages) if len(messages) > 1 else messages[0]
+                # Comments don't apply unless they immediately
+                # precede the message
+                if translator_comments and \
+                        translator_comments[-1][0] < message_lineno - 1:
+                    translator_comments = []
+
+                yield (message_lineno, funcname, messages,
+                       [comment[1] for comment in translator_comments])
+
+                funcname = lineno = message_lineno = None
+                call_stack = -1
+                messages = []
+                translator_comments = []
+                in_translator_comments = False
+                if nested:
+                    funcname = value
+            elif tok == STRING:
+                val = _parse_python_string(value, encoding)
+                if val is not None:
+                    buf.append(val)
+
+            # Python 3.12+, see https://peps.python.org/pep-0701/#new-tokens
+            elif tok == FSTRING_START:
+                current_fstring_start = value
+            elif tok == FSTRING_MIDDLE:
+                if current_fstring_start is not None:
+                    current_fstring_start += value
+            elif tok == FSTRING_END:
+                if current_fstring_start is not None:
+                    fstring = current_fstring_start + value
+                    val = _parse_python_string(fstring, encoding)
+                    if val is not None:
+                        buf.append(val)
+
+            elif tok == OP and value == ',':
+                if buf:
+                    messages.append(''.join(buf))
+                    del buf[:]
+                else:
+                    messages.append(None)
+                if translator_comments:
+                    # We have translator comments, and since we're on a
+                    # comma(,) user is allowed to break into a new line
+                    # Let's increase the last comment's lineno in order
+                    # for the comment to still be a valid one
+                    old_lineno, old_comment = translator_comments.pop()
+                    translator_comments.append((old_lineno + 1, old_comment))
+        elif call_stack > 0 and tok == OP and value == ')':
+            call_stack -= 1
+        elif funcname and call_stack == -1:
+            funcname = None
+        elif tok == NAME and value in keyword_names:
+            funcname = value
+
+        if current_fstring_start is not None and tok not in {FSTRING_START, FSTRING_MIDDLE}:
+            # In Python 3.12, tokens other than FSTRING_* mean the
+            # f-string is dynamic, so we don't wan't to extract it.
+            # And if it's FSTRING_END, we've already handled it above.
+            # Let's forget that we're in an f-string.
+            current_fstring_start = None
+
+def _parse_python_string(value: str, encoding: str) -> str | None:
+    """Return the contents of the Python string literal `value`, or `None` if
+    it is not a plain string; f-strings are only returned if every part of
+    them is constant, others are skipped without a warning.
+    """
+    if value[0] in '\'"' and '\\' not in value and '\r' not in value:
+        # Plain literals without escapes or prefixes (by far the most common
+        # case) are their own contents, no need to compile them
+        quote_len = 3 if value[:3] in ('"""', "'''") and len(value) >= 6 else 1
+        return value[quote_len:-quote_len]
+    # Unwrap quotes in a safe manner, maintaining the string's encoding
+    # https://sourceforge.net/tracker/?func=detail&atid=355470&aid=617979&group_id=5470
+    # No __future__ import changes how string literals are compiled, so the
+    # future flags of the file are not needed here
+    code = compile(f'# coding={str(encoding)}\n{value}', '<string>', 'eval', ast.PyCF_ONLY_AST)
+    if isinstance(code, ast.Expression):
+        body = code.body
+        if isinstance(body, ast.Constant) and isinstance(body.value, str):
+            return body.value
+        if isinstance(body, ast.JoinedStr):  # f-string
+            if all(isinstance(node, ast.Constant) for node in body.values):
+                return ''.join(str(node.value) for node in body.values)
+    return None
 
 def extract_javascript(fileobj: _FileObj, keywords: Mapping[str, _Keyword], comment_tags: Collection[str], options: _JSOptions, lineno: int=1) -> Generator[_ExtractionResult, None, None]:
     """Extract messages from JavaScript source code.
@@ -368,51 +702,126 @@ def extract_javascript(fileobj: _FileObj, keywords: Mapping[str, _Keyword], comm
                                                  template strings.
     :param lineno: line number offset (for parsing embedded fragments)
     """
-    encoding = options.get('encoding', 'utf-8')
-    jsx = options.get('jsx', True)
-    template_string = options.get('template_string', True)
-    parse_template_string = options.get('parse_template_string', False)
-
-    if isinstance(fileobj, str):
-        source = fileobj.encode(encoding)
-    else:
-        source = fileobj.read()
-
-    if isinstance(source, bytes):
-        source = source.decode(encoding)
-
-    tokens = tokenize(source, jsx=jsx, template_string=template_string)
-    
+    from babel.messages.jslexer import Token, tokenize, unquote_string
+    funcname = message_lineno = None
     messages = []
-    comment_stack = []
-    in_gettext = False
-    in_template_string = False
-    current_tuple = []
-
-    for token in tokens:
-        if token.type == 'operator' and token.value == '(' and in_gettext:
-            current_tuple = []
-        elif token.type == 'operator' and token.value == ')' and in_gettext:
-            if current_tuple:
-                messages.append((token.lineno, current_tuple[0], comment_stack, None))
-            in_gettext = False
-            comment_stack = []
-        elif token.type in ('string', 'template_string'):
-            if in_gettext:
-                current_tuple.append(unquote_string(token.value))
-            elif parse_template_string and token.type == 'template_string':
-                in_template_string = True
-                template_messages = parse_template_string(unquote_string(token.value), keywords, comment_tags, options, token.lineno)
-                messages.extend(template_messages)
-                in_template_string = False
-        elif token.type == 'name' and token.value in keywords and not in_gettext:
-            in_gettext = True
-        elif token.type == 'linecomment':
-            comment = token.value[2:].strip()
-            if any(comment.startswith(tag) for tag in comment_tags):
-                comment_stack.append(comment)
-
-    return messages
+    last_argument = None
+    translator_comments = []
+    concatenate_next = False
+    encoding = options.get('encoding', 'utf-8')
+    last_token = None
+    call_stack = -1
+    dotted = any('.' in kw for kw in keywords)
+    comment_tags = tuple(comment_tags)
+    keyword_names = frozenset(keywords)
+    for token in tokenize(
+        fileobj.read().decode(encoding),
+        jsx=options.get("jsx", True),
+        template_string=options.get("template_string", True),
+        dotted=dotted,
+        lineno=lineno,
+    ):
+        if (  # Turn keyword`foo` expressions into keyword("foo") calls:
+            funcname and  # have a keyword...
+            (last_token and last_token.type == 'name') and  # we've seen nothing after the keyword...
+            token.type == 'template_string'  # this is a template string
+        ):
+            message_lineno = token.lineno
+            messages = [unquote_string(token.value)]
+            call_stack = 0
+            token = Token('operator', ')', token.lineno)
+
+        if options.get('parse_template_string') and not funcname and token.type == 'template_string':
+            yield from parse_template_string(token.value, keywords, comment_tags, options, token.lineno)
+
+        elif token.type == 'operator' and token.value == '(':
+            if funcname:
+                message_lineno = token.lineno
+                call_stack += 1
+
+        elif call_stack == -1 and token.type == 'linecomment':
+            value = token.value[2:].strip()
+            if translator_comments and \
+               translator_comments[-1][0] == token.lineno - 1:
+                translator_comments.append((token.lineno, value))
+                continue
+
+            if value.startswith(comment_tags):
+                translator_comments.append((token.lineno, value))
+
+        elif token.type == 'multilinecomment':
+            # only one multi-line comment may precede a translation
+            translator_comments = []
+            value = token.value[2:-2].strip()
+            if value.startswith(comment_tags):
+                lines = value.splitlines()
+                if lines:
+                    lines[0] = lines[0].strip()
+                    lines[1:] = dedent('\n'.join(lines[1:])).splitlines()
+                    for offset, line in enumerate(lines):
+                        translator_comments.append((token.lineno + offset,
+                                                    line))
+
+        elif funcname and call_stack == 0:
+            if token.type == 'operator' and token.value == ')':
+                if last_argument is not None:
+                    messages.append(last_argument)
+                if len(messages) > 1:
+                    messages = tuple(messages)
+                elif messages:
+                    messages = messages[0]
+                else:
+                    messages = None
+
+                # Comments don't apply unless they immediately precede the
+                # message
+                if translator_comments and \
+                   translator_comments[-1][0] < message_lineno - 1:
+                    translator_comments = []
+
+                if messages is not None:
+                    yield (message_lineno, funcname, messages,
+                           [comment[1] for comment in translator_comments])
+
+                funcname = message_lineno = last_argument = None
+                concatenate_next = False
+                translator_comments = []
+                messages = []
+                call_stack = -1
+
+            elif token.type in ('string', 'template_string'):
+                new_value = unquote_string(token.value)
+                if concatenate_next:
+                    last_argument = (last_argument or '') + new_value
+                    concatenate_next = False
+                else:
+                    last_argument = new_value
+
+            elif token.type == 'operator':
+                if token.value == ',':
+                    if last_argument is not None:
+                        messages.append(last_argument)
+                        last_argument = None
+                    else:
+                        messages.append(None)
+                    concatenate_next = False
+                elif token.value == '+':
+                    concatenate_next = True
+
+        elif call_stack > 0 and token.type == 'operator' \
+                and token.value == ')':
+            call_stack -= 1
+
+        elif funcname and call_stack == -1:
+            funcname = None
+
+        elif call_stack == -1 and token.type == 'name' and \
+            token.value in keyword_names and \
+            (last_token is None or last_token.type != 'name' or
+             last_token.value != 'function'):
+            funcname = token.value
+
+        last_token = token
 
 def parse_template_string(template_string: str, keywords: Mapping[str, _Keyword], comment_tags: Collection[str], options: _JSOptions, lineno: int=1) -> Generator[_ExtractionResult, None, None]:
     """Parse JavaScript template string.
@@ -425,33 +834,29 @@ def parse_template_string(template_string: str, keywords: Mapping[str, _Keyword]
     :param options: a dictionary of additional options (optional)
     :param lineno: starting line number (optional)
     """
-    parts = re.split(r'(\$\{.*?\})', template_string)
-    
-    for part in parts:
-        if part.startswith('${') and part.endswith('}'):
-            expression = part[2:-1].strip()
-            tokens = tokenize(expression, jsx=options.get('jsx', True), template_string=options.get('template_string', True))
-            
-            in_gettext = False
-            current_tuple = []
-            comment_stack = []
-            
-            for token in tokens:
-                if token.type == 'operator' and token.value == '(' and in_gettext:
-                    current_tuple = []
-                elif token.type == 'operator' and token.value == ')' and in_gettext:
-                    if current_tuple:
-                        yield lineno, current_tuple[0], comment_stack, None
-                    in_gettext = False
-                    comment_stack = []
-                elif token.type in ('string', 'template_string'):
-                    if in_gettext:
-                        current_tuple.append(unquote_string(token.value))
-                elif token.type == 'name' and token.value in keywords and not in_gettext:
-                    in_gettext = True
-                elif token.type == 'linecomment':
-                    comment = token.value[2:].strip()
-                    if any(comment.startswith(tag) for tag in comment_tags):
-                        comment_stack.append(comment)
-        
-        lineno += part.count('\n')
+    from babel.messages.jslexer import line_re
+    prev_character = None
+    level = 0
+    inside_str = False
+    expression_start = 0
+    template_string = template_string[1:-1]
+    for pos, character in enumerate(template_string):
+        if not inside_str and character in ('"', "'", '`'):
+            inside_str = character
+        elif inside_str == character and prev_character != r'\\':
+            inside_str = False
+        if not inside_str:
+            if character == '{' and prev_character == '$':
+                if not level:
+                    expression_start = pos + 1
+                level += 1
+            elif level and character == '}':
+                level -= 1
+                if level == 0:
+                    # Slice the expression out once instead of collecting
+                    # it character by character
+                    expression_contents = template_string[expression_start:pos]
+                    fake_file_obj = io.BytesIO(expression_contents.encode())
+                    yield from extract_javascript(fake_file_obj, keywords, comment_tags, options, lineno)
+                    lineno += len(line_re.findall(expression_contents))
+        prev_character = character
@@ -10,7 +10,11 @@
 """
 from __future__ import annotations
 import re
+from bisect import bisect_left
 from collections.abc import Generator
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from typing import NamedTuple
 operators: list[str] = sorted(['+', '-', '*', '%', '!=', '==', '<', '>', '<=', '>=', '=', '+=', '-=', '*=', '%=', '<<', '>>', '>>>', '<<=', '>>=', '>>>=', '&', '&=', '|', '|=', '&&', '||', '^', '^=', '(', ')', '[', ']', '{', '}', '!', '--', '++', '~', ',', ';', '.', ':'], key=len, reverse=True)
 escapes: dict[str, str] = {'b': '\x08', 'f': '\x0c', 'n': '\n', 'r': '\r', 't': '\t'}
@@ -20,14 +24,46 @@ division_re = re.compile('/=?')
 regex_re = re.compile('/(?:[^/\\\\]*(?:\\\\.[^/\\\\]*)*)/[a-zA-Z]*', re.DOTALL)
 line_re = re.compile('(\\r\\n|\\n|\\r)')
 line_join_re = re.compile('\\\\' + line_re.pattern)
+_newline_re = re.compile('\n')
+_escape_re = re.compile('\\\\([uU][a-fA-F0-9]{0,4}|[xX][a-fA-F0-9]{0,2}|.)', re.DOTALL)
 uni_escape_re = re.compile('[a-fA-F0-9]{1,4}')
 hex_escape_re = re.compile('[a-fA-F0-9]{1,2}')
 
+def _operator_pattern(operators: list[str]) -> str:
+    """Build a regex matching the longest of `operators` at a position.
+
+    The operators are arranged as a prefix tree, so that the regex engine
+    picks the branch by the first character instead of trying every operator
+    in turn::
+
+        >>> _operator_pattern(['<', '<<', '<=', '<<='])
+        '(<(?:<=?|=)?)'
+
+    Internal to this module.
+    """
+    def build(ops: list[str]) -> str:
+        branches = []
+        for first, group in groupby(sorted(ops), key=itemgetter(0)):
+            rest = [op[1:] for op in group]
+            tails = [tail for tail in rest if tail]
+            if not tails:
+                branches.append(re.escape(first))
+                continue
+            tail = build(tails)
+            if len(tails) > 1 or len(tails[0]) > 1:
+                tail = f'(?:{tail})'
+            branches.append(f'{re.escape(first)}{tail}{"?" if "" in rest else ""}')
+        return '|'.join(branches)
+    return f'({build(operators)})'
+
+#: Regex flags which can be scoped to a single rule in the combined rule regex.
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
 class Token(NamedTuple):
     type: str
     value: str
     lineno: int
-_rules: list[tuple[str | None, re.Pattern[str]]] = [(None, re.compile('\\s+', re.UNICODE)), (None, re.compile('<!--.*')), ('linecomment', re.compile('//.*')), ('multilinecomment', re.compile('/\\*.*?\\*/', re.UNICODE | re.DOTALL)), ('dotted_name', dotted_name_re), ('name', name_re), ('number', re.compile('(\n        (?:0|[1-9]\\d*)\n        (\\.\\d+)?\n        ([eE][-+]?\\d+)? |\n        (0x[a-fA-F0-9]+)\n    )', re.VERBOSE)), ('jsx_tag', re.compile('(?:</?[^>\\s]+|/>)', re.I)), ('operator', re.compile('(%s)' % '|'.join(map(re.escape, operators)))), ('template_string', re.compile('`(?:[^`\\\\]*(?:\\\\.[^`\\\\]*)*)`', re.UNICODE)), ('string', re.compile('(\n        \'(?:[^\'\\\\]*(?:\\\\.[^\'\\\\]*)*)\'  |\n        "(?:[^"\\\\]*(?:\\\\.[^"\\\\]*)*)"\n    )', re.VERBOSE | re.DOTALL))]
+_rules: list[tuple[str | None, re.Pattern[str]]] = [(None, re.compile('\\s+', re.UNICODE)), (None, re.compile('<!--.*')), ('linecomment', re.compile('//.*')), ('multilinecomment', re.compile('/\\*.*?\\*/', re.UNICODE | re.DOTALL)), ('dotted_name', dotted_name_re), ('name', name_re), ('number', re.compile('(\n        (?:0|[1-9]\\d*)\n        (\\.\\d+)?\n        ([eE][-+]?\\d+)? |\n        (0x[a-fA-F0-9]+)\n    )', re.VERBOSE)), ('jsx_tag', re.compile('(?:</?[^>\\s]+|/>)', re.I)), ('operator', re.compile(_operator_pattern(operators))), ('template_string', re.compile('`(?:[^`\\\\]*(?:\\\\.[^`\\\\]*)*)`', re.UNICODE)), ('string', re.compile('(\n        \'(?:[^\'\\\\]*(?:\\\\.[^\'\\\\]*)*)\'  |\n        "(?:[^"\\\\]*(?:\\\\.[^"\\\\]*)*)"\n    )', re.VERBOSE | re.DOTALL))]
 
 def get_rules(jsx: bool, dotted: bool, template_string: bool) -> list[tuple[str | None, re.Pattern[str]]]:
     """
@@ -35,28 +71,63 @@ def get_rules(jsx: bool, dotted: bool, template_string: bool) -> list[tuple[str
 
     Internal to this module.
     """
-    rules = _rules.copy()
-    
-    if not jsx:
-        rules = [rule for rule in rules if rule[0] != 'jsx_tag']
-    
-    if not dotted:
-        rules = [rule for rule in rules if rule[0] != 'dotted_name']
-    
-    if not template_string:
-        rules = [rule for rule in rules if rule[0] != 'template_string']
-    
+    rules = []
+    for token_type, rule in _rules:
+        if not jsx and token_type and 'jsx' in token_type:
+            continue
+        if not template_string and token_type == 'template_string':
+            continue
+        if token_type == 'dotted_name':
+            if not dotted:
+                continue
+            token_type = 'name'
+        rules.append((token_type, rule))
     return rules
 
+@lru_cache(maxsize=None)
+def _get_combined_rule(jsx: bool, dotted: bool, template_string: bool) -> tuple[re.Pattern[str], dict[str, str | None]]:
+    """
+    Combine the rules returned by `get_rules` into a single alternation, so a
+    token is found with one regex match instead of one attempt per rule.
+
+    Each rule becomes a named group; the returned mapping gives the token type
+    for each group name.  As alternatives are tried from left to right, the
+    rule priority is the same as when trying the rules one after the other.
+
+    Internal to this module.
+    """
+    alternatives = []
+    group_types = {}
+    for idx, (token_type, rule) in enumerate(get_rules(jsx, dotted, template_string)):
+        flags = ''.join(flag for mask, flag in _INLINE_FLAGS if rule.flags & mask)
+        group = f'r{idx}'
+        alternatives.append(f'(?P<{group}>(?{flags}:{rule.pattern}))' if flags else f'(?P<{group}>{rule.pattern})')
+        group_types[group] = token_type
+    return re.compile('|'.join(alternatives)), group_types
+
 def indicates_division(token: Token) -> bool:
     """A helper function that helps the tokenizer to decide if the current
     token may be followed by a division operator.
     """
-    if token.type == 'number' or token.type == 'name':
-        return True
     if token.type == 'operator':
-        return token.value in [')', ']', '}', '++', '--']
-    return False
+        return token.value in (')', ']', '}', '++', '--')
+    return token.type in ('name', 'number', 'string', 'regexp')
+
+def _unescape(match: re.Match[str]) -> str:
+    """Return the replacement of an escape sequence matched by `_escape_re`."""
+    escaped = match.group(1)
+    kind, digits = escaped[0], escaped[1:]
+    if kind in 'uU':
+        # unicode escapes need exactly four hexadecimal digits, otherwise
+        # all the consumed characters are put into the string.
+        if len(digits) == 4:
+            return chr(int(digits, 16))
+        return kind + digits
+    if kind in 'xX':
+        # hex escapes. conversion from 2-digits hex to char is infallible
+        return chr(int(digits, 16)) if digits else kind
+    # simple escapes; for a bogus escape just the backslash is removed
+    return escapes.get(kind, kind)
 
 def unquote_string(string: str) -> str:
     """Unquote a string with JavaScript rules.  The string has to start with
@@ -65,36 +136,7 @@ def unquote_string(string: str) -> str:
     quote = string[0]
     if quote not in ('"', "'", '`'):
         raise ValueError('string must start with string delimiter')
-    
-    string = string[1:-1]
-    result = []
-    is_escaping = False
-    
-    for char in string:
-        if is_escaping:
-            if char in escapes:
-                result.append(escapes[char])
-            elif char == 'u':
-                # Unicode escape
-                value = uni_escape_re.match(string[len(result)+1:])
-                if value is not None:
-                    result.append(chr(int(value.group(), 16)))
-                    result.extend([''] * value.end())
-            elif char == 'x':
-                # Hexadecimal escape
-                value = hex_escape_re.match(string[len(result)+1:])
-                if value is not None:
-                    result.append(chr(int(value.group(), 16)))
-                    result.extend([''] * value.end())
-            else:
-                result.append(char)
-            is_escaping = False
-        elif char == '\\':
-            is_escaping = True
-        else:
-            result.append(char)
-    
-    return ''.join(result)
+    return _escape_re.sub(_unescape, string[1:-1])
 
 def tokenize(source: str, jsx: bool=True, dotted: bool=True, template_string: bool=True, lineno: int=1) -> Generator[Token, None, None]:
     """
@@ -105,35 +147,37 @@ def tokenize(source: str, jsx: bool=True, dotted: bool=True, template_string: bo
     :param template_string: Support ES6 template strings
     :param lineno: starting line number (optional)
     """
-    rules = get_rules(jsx, dotted, template_string)
+    combined_rule, group_types = _get_combined_rule(jsx, dotted, template_string)
     source = source.replace('\r\n', '\n').replace('\r', '\n') + '\n'
+    # The line number of a token is derived from the number of newlines
+    # before it, instead of counting the newlines in every token.
+    newlines = [match.start() for match in _newline_re.finditer(source)]
+    may_divide = False
     pos = 0
     end = len(source)
-    last_token = None
 
     while pos < end:
-        for token_type, rule in rules:
-            match = rule.match(source, pos)
-            if match is not None:
-                value = match.group()
-                if token_type is not None:
-                    if token_type == 'operator':
-                        if value == '/' and last_token is not None and indicates_division(last_token):
-                            division_match = division_re.match(source, pos)
-                            if division_match is not None:
-                                value = division_match.group()
-                            else:
-                                regex_match = regex_re.match(source, pos)
-                                if regex_match is not None:
-                                    value = regex_match.group()
-                                    token_type = 'regex'
-                    
-                    token = Token(token_type, value, lineno)
-                    yield token
-                    last_token = token
-                
-                lineno += len(line_re.findall(value))
-                pos = match.end()
-                break
+        match = combined_rule.match(source, pos)
+        if match is not None:
+            token_type = group_types[match.lastgroup]
+        # if we don't have a match we don't give up yet, but check for
+        # division operators or regular expression literals, based on
+        # the status of `may_divide` which is determined by the last
+        # processed non-whitespace token using `indicates_division`.
         else:
-            raise SyntaxError(f'unexpected character {source[pos]!r} at index {pos}')
+            if may_divide:
+                match = division_re.match(source, pos)
+                token_type = 'operator'
+            else:
+                match = regex_re.match(source, pos)
+                token_type = 'regexp'
+            if match is None:
+                # woops. invalid syntax. jump one char ahead and try again.
+                pos += 1
+                continue
+
+        if token_type is not None:
+            token = Token(token_type, match.group(), lineno + bisect_left(newlines, pos))
+            may_divide = indicates_division(token)
+            yield token
+        pos = match.end()
@@ -9,7 +9,10 @@
 """
 from __future__ import annotations
 import array
+import mmap
 import struct
+import sys
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from babel.messages.catalog import Catalog, Message
 if TYPE_CHECKING:
@@ -28,9 +31,29 @@ def read_mo(fileobj: SupportsRead[bytes]) -> Catalog:
            standard library.
     """
     catalog = Catalog()
-    buf = fileobj.read()
+    buf = _map_file(fileobj)
+    try:
+        return _parse_mo(catalog, buf)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+def _map_file(fileobj: SupportsRead[bytes]) -> bytes | mmap.mmap:
+    """Return the contents of `fileobj`, mapped into memory rather than read
+    if it is a regular file positioned at its start."""
+    try:
+        if fileobj.tell() == 0:
+            return mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Not a real (or a non-empty) file
+        pass
+    return fileobj.read()
+
+def _parse_mo(catalog: Catalog, buf: bytes | mmap.mmap) -> Catalog:
+    """Add the messages of the MO file contents `buf` to `catalog`."""
     buflen = len(buf)
     unpack = struct.unpack
+    decode = bytes.decode
 
     # Parse the magic number
     magic = unpack('<I', buf[:4])[0]
@@ -41,40 +64,57 @@ def read_mo(fileobj: SupportsRead[bytes]) -> Catalog:
         version, msgcount, masteridx, transidx = unpack('>4I', buf[4:20])
         ii = '>II'
     else:
-        raise IOError('Invalid magic number')
+        raise OSError('Invalid magic number')
 
     # Parse the version number
     if version not in (0, 1):
-        raise IOError('Unknown MO file version')
+        raise OSError('Unknown MO file version')
+
+    # Parse both index tables at once, as (length, offset) pairs
+    if masteridx + 8 * msgcount > buflen or transidx + 8 * msgcount > buflen:
+        raise OSError('File is corrupt')
+    master_pairs = struct.iter_unpack(ii, buf[masteridx:masteridx + 8 * msgcount])
+    trans_pairs = struct.iter_unpack(ii, buf[transidx:transidx + 8 * msgcount])
 
     # Parse the catalog
-    for i in range(msgcount):
-        mlen, moff = unpack(ii, buf[masteridx:masteridx + 8])
+    charset = 'utf-8'
+    for (mlen, moff), (tlen, toff) in zip(master_pairs, trans_pairs):
         mend = moff + mlen
-        tlen, toff = unpack(ii, buf[transidx:transidx + 8])
         tend = toff + tlen
         if mend > buflen or tend > buflen:
-            raise IOError('File is corrupt')
+            raise OSError('File is corrupt')
+
+        if mlen == 0:
+            # The header entry, which comes first; its Content-Type names
+            # the charset of every message
+            charset = _header_charset(buf[toff:tend]) or charset
 
-        msg = buf[moff:mend]
-        tmsg = buf[toff:tend]
+        # NUL never occurs inside an encoded character, so the plural forms
+        # can be split apart after decoding each buffer as a whole
+        msg = decode(buf[moff:mend], charset)
+        tmsg = decode(buf[toff:tend], charset)
 
-        if b'\x00' in msg:
+        if '\x00' in msg:
             # Plural forms
-            msgid1, msgid2 = msg.split(b'\x00')
-            tmsg = tmsg.split(b'\x00')
+            msgid1, msgid2 = msg.split('\x00')
+            tmsg = tmsg.split('\x00')
             if len(tmsg) > 1:
-                catalog.add((msgid1.decode(), msgid2.decode()), [m.decode() for m in tmsg])
+                catalog.add((msgid1, msgid2), tmsg)
             else:
-                catalog.add((msgid1.decode(), msgid2.decode()), tmsg[0].decode())
+                catalog.add((msgid1, msgid2), tmsg[0])
         else:
-            catalog.add(msg.decode(), tmsg.decode())
-
-        masteridx += 8
-        transidx += 8
+            catalog.add(msg, tmsg)
 
     return catalog
 
+def _header_charset(header: bytes) -> str | None:
+    """Return the charset named by the Content-Type of an MO header entry."""
+    for line in header.splitlines():
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-type' and b'charset=' in value:
+            return value.split(b'charset=')[1].strip().decode('ascii')
+    return None
+
 def write_mo(fileobj: SupportsWrite[bytes], catalog: Catalog, use_fuzzy: bool=False) -> None:
     """Write a catalog to the specified file-like object using the GNU MO file
     format.
@@ -124,39 +164,69 @@ def write_mo(fileobj: SupportsWrite[bytes], catalog: Catalog, use_fuzzy: bool=Fa
                       in the output
     """
     messages = list(catalog)
-    messages.sort()
-
-    ids = strs = b''
-    offsets = []
+    messages[1:] = [m for m in messages[1:]
+                    if m.string and (use_fuzzy or not m.fuzzy)]
 
+    # Encode every key and value up front.  The parts of each are joined as
+    # text and encoded in one go; the NUL and EOT separators encode to the
+    # same single byte in any charset usable in an MO file.
+    entries = []
     for message in messages:
-        if not message.id or (not use_fuzzy and message.fuzzy) or not message.string:
-            continue
-        
-        id = (message.context + '\x04' + message.id if message.context else message.id).encode('utf-8')
-        string = message.string.encode('utf-8') if isinstance(message.string, str) else b'\x00'.join(s.encode('utf-8') for s in message.string)
-        
-        offsets.append((len(ids), len(id), len(strs), len(string)))
-        ids += id + b'\x00'
-        strs += string + b'\x00'
-
-    # The header is 7 32-bit unsigned integers.
-    keystart = 7 * 4 + 16 * len(offsets)
-    valuestart = keystart + len(ids)
-    koffsets = []
-    voffsets = []
-    for o in offsets:
-        koffsets += [o[0] + keystart, o[1]]
-        voffsets += [o[2] + valuestart, o[3]]
-    offsets = koffsets + voffsets
-
-    output = struct.pack('Iiiiiii',
-        LE_MAGIC,                   # magic
-        0,                          # version
-        len(offsets) // 4,          # number of entries
-        7 * 4,                      # start of key index
-        7 * 4 + len(offsets) // 2,  # start of value index
-        0, 0                        # size and offset of hash table
-    ) + array.array("I", offsets).tobytes() + ids + strs
-
-    fileobj.write(output)
+        if message.pluralizable:
+            msgid = '\x00'.join(message.id)
+            msgstrs = []
+            for idx, string in enumerate(message.string):
+                if not string:
+                    msgstrs.append(message.id[min(int(idx), 1)])
+                else:
+                    msgstrs.append(string)
+            msgstr = '\x00'.join(msgstrs)
+        else:
+            msgid = message.id
+            msgstr = message.string
+        if message.context:
+            msgid = f'{message.context}\x04{msgid}'
+        entries.append((msgid.encode(catalog.charset), msgstr.encode(catalog.charset)))
+    # Readers without a hash table binary search the keys as byte strings
+    entries.sort(key=itemgetter(0))
+
+    # The header is 7 32-bit unsigned integers.  We don't use hash tables, so
+    # the keys start right after the index tables, and the values follow
+    # the keys.  Each string is NUL terminated, the NUL does not count into
+    # its size.
+    count = len(entries)
+    keys = [msgid for msgid, _ in entries]
+    values = [msgstr for _, msgstr in entries]
+    keystart = 7 * 4 + 16 * count
+    valuestart = keystart + sum(map(len, keys)) + count
+
+    # Both index tables hold a (size, file offset) pair for each string;
+    # they are filled into one preallocated array, keys first
+    index = array.array('I', bytes(16 * count))
+    koffset = keystart
+    voffset = valuestart
+    for i, (msgid, msgstr) in enumerate(entries):
+        k = 2 * i
+        v = 2 * (count + i)
+        index[k] = len(msgid)
+        index[k + 1] = koffset
+        index[v] = len(msgstr)
+        index[v + 1] = voffset
+        koffset += len(msgid) + 1
+        voffset += len(msgstr) + 1
+    if sys.byteorder == 'big':
+        index.byteswap()
+
+    fileobj.write(struct.pack('<Iiiiiii',
+                              LE_MAGIC,                   # magic
+                              0,                          # version
+                              count,                      # number of entries
+                              7 * 4,                      # start of key index
+                              7 * 4 + count * 8,          # start of value index
+                              0, 0,                       # size and offset of hash table
+                              ) + index.tobytes())
+    # Write the string tables separately rather than concatenating them
+    # with the header into one more copy of the whole file
+    if count:
+        fileobj.write(b'\x00'.join(keys) + b'\x00')
+        fileobj.write(b'\x00'.join(values) + b'\x00')
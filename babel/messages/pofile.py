@@ -15,11 +15,15 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING
 from babel.core import Locale
 from babel.messages.catalog import Catalog, Message
-from babel.util import _cmp, wraptext
+from babel.util import wraptext
 if TYPE_CHECKING:
     from typing import IO, AnyStr
     from _typeshed import SupportsWrite
     from typing_extensions import Literal
+#: Translation table for `escape`, and its reverse for `unescape`.
+_ESCAPES = {ord('\\'): '\\\\', ord('\t'): '\\t', ord('\r'): '\\r', ord('\n'): '\\n', ord('"'): '\\"'}
+_UNESCAPES = {'\\': '\\', 't': '\t', 'r': '\r', 'n': '\n', '"': '"'}
+_unescape_re = re.compile(r'\\([\\trn"])')
 
 def unescape(string: str) -> str:
     """Reverse `escape` the given string.
@@ -31,7 +35,10 @@ def unescape(string: str) -> str:
 
     :param string: the string to unescape
     """
-    return string[1:-1].replace(r'\\', '\\').replace(r'\"', '"')
+    return _unescape_re.sub(_replace_escape, string[1:-1])
+
+def _replace_escape(match: re.Match[str]) -> str:
+    return _UNESCAPES[match.group(1)]
 
 def denormalize(string: str) -> str:
     """Reverse the normalization done by the `normalize` function.
@@ -54,9 +61,13 @@ def denormalize(string: str) -> str:
 
     :param string: the string to denormalize
     """
+    if '\n' not in string:
+        # A single quoted line, which is the common case
+        return unescape(string)
+    escaped_lines = string.splitlines()
     if string.startswith('""'):
-        string = string[3:-1]  # Remove leading '""' and trailing newline
-    return unescape(string.replace('"\n"', ''))
+        escaped_lines = escaped_lines[1:]
+    return ''.join(map(unescape, escaped_lines))
 
 class PoFileError(Exception):
     """Exception thrown by PoParser when an invalid po file is encountered."""
@@ -71,37 +82,45 @@ class _NormalizedString:
 
     def __init__(self, *args: str) -> None:
         self._strs: list[str] = []
+        # The lines joined with `os.linesep`, built on first use
+        self._joined: str | None = None
         for arg in args:
             self.append(arg)
 
+    def append(self, s: str) -> None:
+        self._strs.append(s.strip())
+        self._joined = None
+
+    def denormalize(self) -> str:
+        return ''.join(map(unescape, self._strs))
+
     def __bool__(self) -> bool:
         return bool(self._strs)
 
     def __repr__(self) -> str:
-        return os.linesep.join(self._strs)
+        if self._joined is None:
+            self._joined = os.linesep.join(self._strs)
+        return self._joined
 
-    def __cmp__(self, other: object) -> int:
-        if not other:
-            return 1
-        return _cmp(str(self), str(other))
+    # An empty or missing `other` sorts before any normalized string
 
     def __gt__(self, other: object) -> bool:
-        return self.__cmp__(other) > 0
+        return not other or self.__repr__() > str(other)
 
     def __lt__(self, other: object) -> bool:
-        return self.__cmp__(other) < 0
+        return bool(other) and self.__repr__() < str(other)
 
     def __ge__(self, other: object) -> bool:
-        return self.__cmp__(other) >= 0
+        return not other or self.__repr__() >= str(other)
 
     def __le__(self, other: object) -> bool:
-        return self.__cmp__(other) <= 0
+        return bool(other) and self.__repr__() <= str(other)
 
     def __eq__(self, other: object) -> bool:
-        return self.__cmp__(other) == 0
+        return bool(other) and self.__repr__() == str(other)
 
     def __ne__(self, other: object) -> bool:
-        return self.__cmp__(other) != 0
+        return not other or self.__repr__() != str(other)
 
 class PoFileParser:
     """Support class to  read messages from a ``gettext`` PO (portable object) file
@@ -119,46 +138,180 @@ class PoFileParser:
         self.abort_invalid = abort_invalid
         self._reset_message_state()
 
+    def _reset_message_state(self) -> None:
+        self.messages = []
+        self.translations = []
+        self.locations = []
+        self.flags = []
+        self.user_comments = []
+        self.auto_comments = []
+        self.context = None
+        self.obsolete = False
+        self.in_msgid = False
+        self.in_msgstr = False
+        self.in_msgctxt = False
+
     def _add_message(self) -> None:
         """
         Add a message to the catalog based on the current parser state and
         clear the state ready to process the next message.
         """
-        if self.msgid:
-            message = Message(
-                id=self.msgid,
-                string=self.msgstr,
-                locations=self.locations,
-                flags=self.flags,
-                auto_comments=self.auto_comments,
-                user_comments=self.user_comments,
-                previous_id=self.previous_msgid,
-                lineno=self.lineno,
-                context=self.msgctxt
-            )
-            self.catalog[self.msgid] = message
+        self.translations.sort()
+        if len(self.messages) > 1:
+            msgid = tuple(m.denormalize() for m in self.messages)
+        else:
+            msgid = self.messages[0].denormalize()
+        if isinstance(msgid, (list, tuple)):
+            string = ['' for _ in range(self.catalog.num_plurals)]
+            for idx, translation in self.translations:
+                if idx >= self.catalog.num_plurals:
+                    self._invalid_pofile("", self.offset, "msg has more translations than num_plurals of catalog")
+                    continue
+                string[idx] = translation.denormalize()
+            string = tuple(string)
+        else:
+            string = self.translations[0][1].denormalize()
+        msgctxt = self.context.denormalize() if self.context else None
+        message = Message(msgid, string, list(self.locations), set(self.flags),
+                          self.auto_comments, self.user_comments, lineno=self.offset + 1,
+                          context=msgctxt)
+        if self.obsolete:
+            if not self.ignore_obsolete:
+                self.catalog.obsolete[msgid] = message
+        else:
+            self.catalog[msgid] = message
+        self.counter += 1
         self._reset_message_state()
 
+    def _finish_current_message(self) -> None:
+        if self.messages:
+            self._add_message()
+
+    def _process_message_line(self, lineno, line, obsolete=False) -> None:
+        if line.startswith('"'):
+            self._process_string_continuation_line(line, lineno)
+        else:
+            self._process_keyword_line(lineno, line, obsolete)
+
+    def _process_keyword_line(self, lineno, line, obsolete=False) -> None:
+
+        for keyword in self._keywords:
+            try:
+                if line.startswith(keyword) and line[len(keyword)] in [' ', '[']:
+                    arg = line[len(keyword):]
+                    break
+            except IndexError:
+                self._invalid_pofile(line, lineno, "Keyword must be followed by a string")
+        else:
+            self._invalid_pofile(line, lineno, "Start of line didn't match any expected keyword.")
+            return
+
+        if keyword in ['msgid', 'msgctxt']:
+            self._finish_current_message()
+
+        self.obsolete = obsolete
+
+        # The line that has the msgid is stored as the offset of the msg
+        # should this be the msgctxt if it has one?
+        if keyword == 'msgid':
+            self.offset = lineno
+
+        if keyword in ['msgid', 'msgid_plural']:
+            self.in_msgctxt = False
+            self.in_msgid = True
+            self.messages.append(_NormalizedString(arg))
+
+        elif keyword == 'msgstr':
+            self.in_msgid = False
+            self.in_msgstr = True
+            if arg.startswith('['):
+                idx, msg = arg[1:].split(']', 1)
+                self.translations.append([int(idx), _NormalizedString(msg)])
+            else:
+                self.translations.append([0, _NormalizedString(arg)])
+
+        elif keyword == 'msgctxt':
+            self.in_msgctxt = True
+            self.context = _NormalizedString(arg)
+
+    def _process_string_continuation_line(self, line, lineno) -> None:
+        if self.in_msgid:
+            s = self.messages[-1]
+        elif self.in_msgstr:
+            s = self.translations[-1][1]
+        elif self.in_msgctxt:
+            s = self.context
+        else:
+            self._invalid_pofile(line, lineno, "Got line starting with \" but not in msgid, msgstr or msgctxt")
+            return
+        s.append(line)
+
+    def _process_comment(self, line) -> None:
+
+        self._finish_current_message()
+
+        if line[1:].startswith(':'):
+            for location in line[2:].lstrip().split():
+                pos = location.rfind(':')
+                if pos >= 0:
+                    try:
+                        lineno = int(location[pos + 1:])
+                    except ValueError:
+                        continue
+                    self.locations.append((location[:pos], lineno))
+                else:
+                    self.locations.append((location, None))
+        elif line[1:].startswith(','):
+            for flag in line[2:].lstrip().split(','):
+                self.flags.append(flag.strip())
+        elif line[1:].startswith('.'):
+            # These are called auto-comments
+            comment = line[2:].strip()
+            if comment:  # Just check that we're not adding empty comments
+                self.auto_comments.append(comment)
+        else:
+            # These are called user comments
+            self.user_comments.append(line[1:].strip())
+
     def parse(self, fileobj: IO[AnyStr]) -> None:
         """
         Reads from the file-like object `fileobj` and adds any po file
         units found in it to the `Catalog` supplied to the constructor.
-        """
-        self._reset_message_state()
-        self.counter = 0
-        self.offset = 0
 
-        for line in fileobj:
-            line = line.decode('utf-8') if isinstance(line, bytes) else line
-            self.counter += 1
-            self.offset += len(line)
+        `fileobj` may be a text or binary stream, or any iterable of lines;
+        binary lines are decoded with the catalog's charset, which the
+        header entry may change part-way through the file.
+        """
 
-            if line.strip():
-                self._process_line(line)
+        for lineno, line in enumerate(fileobj):
+            line = line.strip()
+            if not isinstance(line, str):
+                line = line.decode(self.catalog.charset)
+            if not line:
+                continue
+            if line.startswith('#'):
+                if line[1:].startswith('~'):
+                    self._process_message_line(lineno, line[2:].lstrip(), obsolete=True)
+                else:
+                    self._process_comment(line)
             else:
-                self._flush_message()
+                self._process_message_line(lineno, line)
+
+        self._finish_current_message()
 
-        self._flush_message()
+        # No actual messages found, but there was some info in comments, from which
+        # we'll construct an empty header message
+        if not self.counter and (self.flags or self.user_comments or self.auto_comments):
+            self.messages.append(_NormalizedString('""'))
+            self.translations.append([0, _NormalizedString('""')])
+            self._add_message()
+
+    def _invalid_pofile(self, line, lineno, msg) -> None:
+        assert isinstance(line, str)
+        if self.abort_invalid:
+            raise PoFileError(msg, self.catalog, line, lineno)
+        print("WARNING:", msg)
+        print(f"WARNING: Problem on line {lineno + 1}: {line!r}")
 
 def read_po(fileobj: IO[AnyStr], locale: str | Locale | None=None, domain: str | None=None, ignore_obsolete: bool=False, charset: str | None=None, abort_invalid: bool=False) -> Catalog:
     """Read messages from a ``gettext`` PO (portable object) file from the given
@@ -198,7 +351,8 @@ def read_po(fileobj: IO[AnyStr], locale: str | Locale | None=None, domain: str |
     .. versionadded:: 1.0
        Added support for explicit charset argument.
 
-    :param fileobj: the file-like object to read the PO file from
+    :param fileobj: the file-like object to read the PO file from, opened in
+                    either text or binary mode
     :param locale: the locale identifier or `Locale` object, or `None`
                    if the catalog is not bound to a locale (which basically
                    means it's a template)
@@ -211,7 +365,11 @@ def read_po(fileobj: IO[AnyStr], locale: str | Locale | None=None, domain: str |
     parser = PoFileParser(catalog, ignore_obsolete=ignore_obsolete, abort_invalid=abort_invalid)
     parser.parse(fileobj)
     return catalog
-WORD_SEP = re.compile('(\\s+|[^\\s\\w]*\\w+[a-zA-Z]-(?=\\w+[a-zA-Z])|(?<=[\\w\\!\\"\\\'\\&\\.\\,\\?])-{2,}(?=\\w))')
+WORD_SEP = re.compile('('
+                      r'\s+|'                                 # any whitespace
+                      r'[^\s\w]*\w+[a-zA-Z]-(?=\w+[a-zA-Z])|'  # hyphenated words
+                      r'(?<=[\w\!\"\'\&\.\,\?])-{2,}(?=\w)'   # em-dash
+                      ')')
 
 def escape(string: str) -> str:
     """Escape the given string so that it can be included in double-quoted
@@ -224,7 +382,7 @@ def escape(string: str) -> str:
 
     :param string: the string to escape
     """
-    return '"%s"' % string.replace('\\', '\\\\').replace('\t', '\\t').replace('\r', '\\r').replace('\n', '\\n').replace('"', '\\"')
+    return '"%s"' % string.translate(_ESCAPES)
 
 def normalize(string: str, prefix: str='', width: int=76) -> str:
     """Convert a string into a format that is appropriate for .po files.
@@ -251,22 +409,40 @@ def normalize(string: str, prefix: str='', width: int=76) -> str:
                   to completely disable line wrapping
     """
     if width and width > 0:
+        prefixlen = len(prefix)
         lines = []
-        for idx, line in enumerate(string.splitlines(True)):
-            if len(prefix + line) > width:
-                chunks = []
-                for chunk in line.split():
-                    if chunks and len(prefix + ' '.join(chunks + [chunk])) > width:
-                        lines.append(prefix + ' '.join(chunks))
-                        chunks = []
-                    chunks.append(chunk)
-                if chunks:
-                    lines.append(prefix + ' '.join(chunks))
+        for line in string.splitlines(True):
+            if len(escape(line)) + prefixlen > width:
+                chunks = WORD_SEP.split(line)
+                chunks.reverse()
+                while chunks:
+                    buf = []
+                    size = 2
+                    while chunks:
+                        length = len(escape(chunks[-1])) - 2 + prefixlen
+                        if size + length < width:
+                            buf.append(chunks.pop())
+                            size += length
+                        else:
+                            if not buf:
+                                # handle long chunks by putting them on a
+                                # separate line
+                                buf.append(chunks.pop())
+                            break
+                    lines.append(''.join(buf))
             else:
-                lines.append(prefix + line)
-        string = ''.join(lines)
-    
-    return '""' + ''.join('\n"%s"' % escape(line)[1:-1] for line in string.splitlines(True))
+                lines.append(line)
+    else:
+        lines = string.splitlines(True)
+
+    if len(lines) <= 1:
+        return escape(string)
+
+    # Remove empty trailing line
+    if lines and not lines[-1]:
+        del lines[-1]
+        lines[-1] += '\n'
+    return '""\n' + '\n'.join([(prefix + escape(line)) for line in lines])
 
 def write_po(fileobj: SupportsWrite[bytes], catalog: Catalog, width: int=76, no_location: bool=False, omit_header: bool=False, sort_output: bool=False, sort_by_file: bool=False, ignore_obsolete: bool=False, include_previous: bool=False, include_lineno: bool=True) -> None:
     """Write a ``gettext`` PO (portable object) template file for a given
@@ -312,66 +488,119 @@ def write_po(fileobj: SupportsWrite[bytes], catalog: Catalog, width: int=76, no_
                              updating the catalog
     :param include_lineno: include line number in the location comment
     """
-    def write(text):
-        if isinstance(text, str):
-            text = text.encode(catalog.charset)
-        fileobj.write(text)
+    charset = catalog.charset
+    fileobj_write = fileobj.write
+    # The text of the header or of one entry is collected here, and then
+    # encoded and written in one go by `flush`
+    parts = []
+    write = parts.append
+
+    def flush():
+        fileobj_write(''.join(parts).encode(charset, 'backslashreplace'))
+        parts.clear()
+
+    def _normalize(key, prefix=''):
+        return normalize(key, prefix=prefix, width=width)
+
+    def _write_comment(comment, prefix=''):
+        # xgettext always wraps comments even if --no-wrap is passed;
+        # provide the same behaviour
+        _width = width if width and width > 0 else 76
+        for line in wraptext(comment, _width):
+            write(f"#{prefix} {line.strip()}\n")
+
+    def _write_message(message, prefix=''):
+        if message.context:
+            write(f"{prefix}msgctxt {_normalize(message.context, prefix)}\n")
+        if isinstance(message.id, (list, tuple)):
+            write(f"{prefix}msgid {_normalize(message.id[0], prefix)}\n")
+            write(f"{prefix}msgid_plural {_normalize(message.id[1], prefix)}\n")
+
+            for idx in range(catalog.num_plurals):
+                try:
+                    string = message.string[idx]
+                except IndexError:
+                    string = ''
+                write(f"{prefix}msgstr[{idx:d}] {_normalize(string, prefix)}\n")
+        else:
+            write(f"{prefix}msgid {_normalize(message.id, prefix)}\n")
+            write(f"{prefix}msgstr {_normalize(message.string or '', prefix)}\n")
+
+    sort_by = None
+    if sort_output:
+        sort_by = "message"
+    elif sort_by_file:
+        sort_by = "location"
+
+    for message in _sort_messages(catalog, sort_by=sort_by):
+        if not message.id:  # This is the header "message"
+            if omit_header:
+                continue
+            comment_header = catalog.header_comment
+            if width and width > 0:
+                lines = []
+                for line in comment_header.splitlines():
+                    lines += wraptext(line, width=width,
+                                      subsequent_indent='# ')
+                comment_header = '\n'.join(lines)
+            write(f"{comment_header}\n")
 
-    def write_comment(comment, prefix=''):
-        if comment:
-            write(f'# {prefix}{comment}\n'.encode(catalog.charset))
+        for comment in message.user_comments:
+            _write_comment(comment)
+        for comment in message.auto_comments:
+            _write_comment(comment, prefix='.')
 
-    def write_entry(message, plural=False):
         if not no_location:
-            for filename, lineno in message.locations:
-                if include_lineno and lineno:
-                    write(f'#: {filename}:{lineno}\n')
-                else:
-                    write(f'#: {filename}\n')
-        if message.flags:
-            write('#, ' + ', '.join(sorted(message.flags)) + '\n')
-        if message.previous_id and include_previous:
-            write_comment(f'msgid {message.previous_id[0]}', 'Previous ')
+            locs = []
+
+            # sort locations by filename and lineno.
+            # if there's no <int> as lineno, use `-1`.
+            # if no sorting possible, leave unsorted.
+            # (see issue #606)
+            try:
+                locations = sorted(message.locations,
+                                   key=lambda x: (x[0], isinstance(x[1], int) and x[1] or -1))
+            except TypeError:  # e.g. "TypeError: unorderable types: NoneType() < int()"
+                locations = message.locations
+
+            for filename, lineno in locations:
+                location = filename.replace(os.sep, '/')
+                if lineno and include_lineno:
+                    location = f"{location}:{lineno:d}"
+                if location not in locs:
+                    locs.append(location)
+            _write_comment(' '.join(locs), prefix=':')
+        flags = message.flags
+        if flags:
+            # Most messages carry a single flag, which needs no sorting
+            if len(flags) > 1:
+                flags = sorted(flags)
+            write(f"#, {', '.join(flags)}\n")
+
+        if include_previous and message.previous_id:
+            _write_comment(
+                f'msgid {_normalize(message.previous_id[0])}',
+                prefix='|',
+            )
             if len(message.previous_id) > 1:
-                write_comment(f'msgid_plural {message.previous_id[1]}', 'Previous ')
-        for comment in message.auto_comments:
-            write_comment(comment, '.')
-        for comment in message.user_comments:
-            write_comment(comment)
-        write('msgid ' + normalize(message.id, width=width))
-        if plural:
-            write('msgid_plural ' + normalize(message.id[1], width=width))
-            for idx, string in enumerate(message.string):
-                write(f'msgstr[{idx}] {normalize(string, width=width)}')
-        else:
-            write('msgstr ' + normalize(message.string or '', width=width))
-        write('\n')
+                _write_comment('msgid_plural %s' % _normalize(
+                    message.previous_id[1],
+                ), prefix='|')
 
-    messages = sorted(catalog) if sort_output else catalog
-    if sort_by_file:
-        messages = sorted(messages, key=lambda m: m.locations)
-
-    if not omit_header:
-        write('msgid ""\n')
-        write('msgstr ""\n')
-        for line in catalog.header_comment.splitlines():
-            write(f'# {line}\n')
-        for name, value in catalog.mime_headers:
-            write(f'"{name}: {value}\\n"\n')
+        _write_message(message)
         write('\n')
-
-    for message in messages:
-        if not message.id or (ignore_obsolete and message.obsolete):
-            continue
-        if isinstance(message.id, (list, tuple)):
-            write_entry(message, plural=True)
-        else:
-            write_entry(message)
+        flush()
 
     if not ignore_obsolete:
-        for message in catalog.obsolete.values():
-            write('#~ ')
-            write_entry(message)
+        for message in _sort_messages(
+            catalog.obsolete.values(),
+            sort_by=sort_by,
+        ):
+            for comment in message.user_comments:
+                _write_comment(comment)
+            _write_message(message, prefix='#~ ')
+            write('\n')
+            flush()
 
 def _sort_messages(messages: Iterable[Message], sort_by: Literal['message', 'location']) -> list[Message]:
     """
@@ -383,9 +612,9 @@ def _sort_messages(messages: Iterable[Message], sort_by: Literal['message', 'loc
     :param sort_by: Sort by which criteria? Options are `message` and `location`.
     :return: list[Message]
     """
-    if sort_by == 'message':
-        return sorted(messages, key=lambda m: m.id)
-    elif sort_by == 'location':
-        return sorted(messages, key=lambda m: m.locations[0] if m.locations else ('', 0))
-    else:
-        raise ValueError(f"Invalid sort_by value: {sort_by}")
+    messages = list(messages)
+    if sort_by == "message":
+        messages.sort()
+    elif sort_by == "location":
+        messages.sort(key=lambda m: m.locations)
+    return messages
@@ -19,10 +19,13 @@ import datetime
 import decimal
 import re
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast, overload
 from babel.core import Locale, default_locale, get_global
 from babel.localedata import LocaleDataDict
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from typing_extensions import Literal
 LC_NUMERIC = default_locale('LC_NUMERIC')
 
@@ -37,6 +40,18 @@ class UnknownCurrencyError(Exception):
         Exception.__init__(self, f'Unknown currency {identifier!r}.')
         self.identifier = identifier
 
+@lru_cache(maxsize=1024)
+def _parse_locale(identifier: str) -> Locale:
+    """Return the `Locale` for `identifier`, parsing it only once."""
+    return Locale.parse(identifier)
+
+def _get_locale(locale: Locale | str | None) -> Locale | None:
+    """Return `locale` as a `Locale` object, parsing locale identifiers
+    through a cache.  Anything but a string is returned unchanged."""
+    if isinstance(locale, str):
+        return _parse_locale(locale)
+    return locale
+
 def list_currencies(locale: Locale | str | None=None) -> set[str]:
     """ Return a `set` of normalized currency codes.
 
@@ -47,19 +62,16 @@ def list_currencies(locale: Locale | str | None=None) -> set[str]:
                    provided, returns the list of all currencies from all
                    locales.
     """
-    if locale is None:
-        return set(get_global('currency_fractions').keys())
-    
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-    
-    territory = locale.territory
-    currencies = get_global('territory_currencies')
-    
-    if territory in currencies:
-        return set(currency for currency, _ in currencies[territory])
-    
-    return set()
+    return set(_get_currency_codes(_get_locale(locale) if locale else None))
+
+@lru_cache(maxsize=256)
+def _get_currency_codes(locale: Locale | None) -> frozenset[str]:
+    """Return the currency codes of `locale`, or all known codes if it is
+    `None`, as a cached `frozenset`."""
+    # Get locale-scoped currencies.
+    if locale:
+        return frozenset(locale.currencies)
+    return frozenset(get_global('all_currencies'))
 
 def validate_currency(currency: str, locale: Locale | str | None=None) -> None:
     """ Check the currency code is recognized by Babel.
@@ -69,7 +81,7 @@ def validate_currency(currency: str, locale: Locale | str | None=None) -> None:
 
     Raises a `UnknownCurrencyError` exception if the currency is unknown to Babel.
     """
-    if currency not in list_currencies(locale):
+    if currency not in _get_currency_codes(_get_locale(locale) if locale else None):
         raise UnknownCurrencyError(currency)
 
 def is_currency(currency: str, locale: Locale | str | None=None) -> bool:
@@ -77,11 +89,9 @@ def is_currency(currency: str, locale: Locale | str | None=None) -> bool:
 
     This method always return a Boolean and never raise.
     """
-    try:
-        validate_currency(currency, locale)
-        return True
-    except UnknownCurrencyError:
+    if not currency or not isinstance(currency, str):
         return False
+    return currency in _get_currency_codes(_get_locale(locale) if locale else None)
 
 def normalize_currency(currency: str, locale: Locale | str | None=None) -> str | None:
     """Returns the normalized identifier of any currency code.
@@ -91,7 +101,8 @@ def normalize_currency(currency: str, locale: Locale | str | None=None) -> str |
 
     Returns None if the currency is unknown to Babel.
     """
-    currency = currency.upper()
+    if isinstance(currency, str):
+        currency = currency.upper()
     if is_currency(currency, locale):
         return currency
     return None
@@ -109,18 +120,30 @@ def get_currency_name(currency: str, count: float | decimal.Decimal | None=None,
                   will be pluralized to that number if possible.
     :param locale: the `Locale` object or locale identifier.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
+    plural_form = None
     if count is not None:
-        plural_form = locale.plural_form(count)
-    else:
-        plural_form = 'other'
-
-    currency_names = locale.currencies.get(currency)
-    if currency_names:
-        return currency_names.get(plural_form) or currency_names.get('other')
-    return currency
+        try:
+            plural_form = locale.plural_form(count)
+        except (OverflowError, ValueError):
+            plural_form = 'other'
+    return _get_currency_name(currency, plural_form, locale)
+
+@lru_cache(maxsize=4096)
+def _get_currency_name(currency: str, plural_form: str | None, locale: Locale) -> str:
+    """Return the name of `currency` in `locale`, for `plural_form` if it is
+    not `None`.  Only the plural form depends on the count, so the names are
+    cached by it."""
+    if plural_form is not None:
+        plural_names = locale._data['currency_names_plural']
+        if currency in plural_names:
+            currency_plural_names = plural_names[currency]
+            if plural_form in currency_plural_names:
+                return currency_plural_names[plural_form]
+            if 'other' in currency_plural_names:
+                return currency_plural_names['other']
+    return locale.currencies.get(currency, currency)
 
 def get_currency_symbol(currency: str, locale: Locale | str | None=LC_NUMERIC) -> str:
     """Return the symbol used by the locale for the specified currency.
@@ -131,8 +154,7 @@ def get_currency_symbol(currency: str, locale: Locale | str | None=LC_NUMERIC) -
     :param currency: the currency code.
     :param locale: the `Locale` object or locale identifier.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     return locale.currency_symbols.get(currency, currency)
 
@@ -146,7 +168,8 @@ def get_currency_precision(currency: str) -> int:
 
     :param currency: the currency code.
     """
-    return get_global('currency_fractions').get(currency, {}).get('digits', 2)
+    precisions = get_global('currency_fractions')
+    return precisions.get(currency, precisions['DEFAULT'])[0]
 
 def get_currency_unit_pattern(currency: str, count: float | decimal.Decimal | None=None, locale: Locale | str | None=LC_NUMERIC) -> str:
     """
@@ -166,16 +189,15 @@ def get_currency_unit_pattern(currency: str, count: float | decimal.Decimal | No
                   pattern for that number will be returned.
     :param locale: the `Locale` object or locale identifier.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
+    patterns = locale._data['currency_unit_patterns']
     if count is not None:
         plural_form = locale.plural_form(count)
-    else:
-        plural_form = 'other'
-
-    patterns = locale.currency_formats.get('unit_patterns', {})
-    return patterns.get(plural_form, '{0} {1}')
+        if plural_form in patterns:
+            return patterns[plural_form]
+    # Fall back to 'other'
+    return patterns['other']
 
 def get_territory_currencies(territory: str, start_date: datetime.date | None=None, end_date: datetime.date | None=None, tender: bool=True, non_tender: bool=False, include_details: bool=False) -> list[str] | list[dict[str, Any]]:
     """Returns the list of currencies for the given territory that are valid for
@@ -232,15 +254,8 @@ def get_territory_currencies(territory: str, start_date: datetime.date | None=No
     if end_date is None:
         end_date = start_date
 
-    currencies = get_global('territory_currencies').get(territory, [])
     result = []
-
-    for currency_info in currencies:
-        currency = currency_info['currency']
-        from_date = currency_info.get('from')
-        to_date = currency_info.get('to')
-        is_tender = currency_info.get('tender', True)
-
+    for currency, from_date, to_date, is_tender in _get_territory_currency_dates(territory.upper()):
         if from_date and from_date > end_date:
             continue
         if to_date and to_date < start_date:
@@ -262,10 +277,49 @@ def get_territory_currencies(territory: str, start_date: datetime.date | None=No
 
     return result
 
+@lru_cache(maxsize=256)
+def _get_territory_currency_dates(territory: str) -> tuple[tuple[str, datetime.date | None, datetime.date | None, bool], ...]:
+    """Return the ``(currency, from, to, tender)`` entries of `territory`
+    from the global data, with the dates converted to `datetime.date`
+    objects once rather than on every query."""
+    return tuple(
+        (currency, start and datetime.date(*start), end and datetime.date(*end), is_tender)
+        for currency, start, end, is_tender in get_global('territory_currencies').get(territory, ())
+    )
+
 class UnsupportedNumberingSystemError(Exception):
     """Exception thrown when an unsupported numbering system is requested for the given Locale."""
     pass
 
+@lru_cache(maxsize=512)
+def _get_number_symbols(locale: Locale | str | None, numbering_system: Literal['default'] | str='latn') -> LocaleDataDict:
+    """Return the number symbols of `locale` for `numbering_system`, where
+    "default" stands for the default numbering system of the locale.
+
+    The symbols are cached, so repeated lookups skip parsing the locale
+    identifier and resolving the locale data.
+
+    :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
+    """
+    locale = _get_locale(locale)
+    if numbering_system == 'default':
+        numbering_system = locale.default_numbering_system
+    try:
+        return locale.number_symbols[numbering_system]
+    except KeyError:
+        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+
+@lru_cache(maxsize=512)
+def _get_separators(locale: Locale | str | None, numbering_system: Literal['default'] | str='latn') -> tuple[str, str]:
+    """Return the group and decimal symbols of `locale` for `numbering_system`.
+
+    The formatting and parsing code needs only these two symbols, and
+    reading them from a plain tuple avoids the alias resolution of
+    `LocaleDataDict` on every call.
+    """
+    symbols = _get_number_symbols(locale, numbering_system)
+    return symbols.get('group', ','), symbols.get('decimal', '.')
+
 def get_decimal_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the symbol used by the locale to separate decimal fractions.
 
@@ -281,16 +335,7 @@ def get_decimal_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_syst
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['decimal']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('decimal', '.')
 
 def get_plus_sign_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the plus sign symbol used by the current locale.
@@ -307,16 +352,7 @@ def get_plus_sign_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_sy
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['plusSign']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('plusSign', '+')
 
 def get_minus_sign_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the minus sign symbol used by the current locale.
@@ -333,16 +369,7 @@ def get_minus_sign_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_s
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['minusSign']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('minusSign', '-')
 
 def get_exponential_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the symbol used by the locale to separate mantissa and exponent.
@@ -359,16 +386,7 @@ def get_exponential_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['exponential']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('exponential', 'E')
 
 def get_group_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the symbol used by the locale to separate groups of thousands.
@@ -385,16 +403,7 @@ def get_group_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['group']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('group', ',')
 
 def get_infinity_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the symbol used by the locale to represent infinity.
@@ -411,16 +420,7 @@ def get_infinity_symbol(locale: Locale | str | None=LC_NUMERIC, *, numbering_sys
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
-
-    try:
-        return locale.number_symbols[numbering_system]['infinity']
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+    return _get_number_symbols(locale, numbering_system).get('infinity', '∞')
 
 def format_number(number: float | decimal.Decimal | str, locale: Locale | str | None=LC_NUMERIC) -> str:
     """Return the given number formatted for a specific locale.
@@ -455,6 +455,11 @@ def get_decimal_quantum(precision: int | decimal.Decimal) -> decimal.Decimal:
         return precision.normalize().as_tuple().exponent
     return decimal.Decimal('0.1') ** precision
 
+@lru_cache(maxsize=32)
+def _get_quantum(precision: int) -> decimal.Decimal:
+    """Like `get_decimal_quantum`, but each quantum is computed only once."""
+    return get_decimal_quantum(precision)
+
 def format_decimal(number: float | decimal.Decimal | str, format: str | NumberPattern | None=None, locale: Locale | str | None=LC_NUMERIC, decimal_quantization: bool=True, group_separator: bool=True, *, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the given decimal number formatted for a specific locale.
 
@@ -503,8 +508,7 @@ def format_decimal(number: float | decimal.Decimal | str, format: str | NumberPa
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if isinstance(number, str):
         number = decimal.Decimal(number)
@@ -512,17 +516,31 @@ def format_decimal(number: float | decimal.Decimal | str, format: str | NumberPa
     if format is None:
         format = locale.decimal_formats[None]
     if isinstance(format, str):
-        format = parse_pattern(format)
+        format = _get_pattern(format)
 
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
+    return format.apply(number, locale, decimal_quantization=decimal_quantization, group_separator=group_separator, numbering_system=numbering_system)
 
-    try:
-        symbols = locale.number_symbols[numbering_system]
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+def format_decimal_many(numbers: Iterable[float | decimal.Decimal | str], format: str | NumberPattern | None=None, locale: Locale | str | None=LC_NUMERIC, decimal_quantization: bool=True, group_separator: bool=True, *, numbering_system: Literal['default'] | str='latn') -> list[str]:
+    """Return the given decimal numbers formatted for a specific locale.
+
+    This gives the same results as calling `format_decimal` on each number,
+    but the locale and the pattern are only resolved once, so it is the
+    preferred way of formatting many numbers the same way.
 
-    return format.apply(number, locale, decimal_quantization=decimal_quantization, group_separator=group_separator, symbols=symbols)
+    >>> format_decimal_many([1.2345, 12345.5, -1], locale='en_US')
+    [u'1.234', u'12,345.5', u'-1']
+
+    See `format_decimal` for the meaning of the other parameters.
+
+    :param numbers: the numbers to format
+    :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
+    """
+    locale = _get_locale(locale)
+    if format is None:
+        format = locale.decimal_formats[None]
+    pattern = _get_pattern(format)
+    apply = pattern.apply
+    return [apply(number, locale, decimal_quantization=decimal_quantization, group_separator=group_separator, numbering_system=numbering_system) for number in numbers]
 
 def format_compact_decimal(number: float | decimal.Decimal | str, *, format_type: Literal['short', 'long']='short', locale: Locale | str | None=LC_NUMERIC, fraction_digits: int=0, numbering_system: Literal['default'] | str='latn') -> str:
     """Return the given decimal number formatted for a specific locale in compact form.
@@ -550,8 +568,7 @@ def format_compact_decimal(number: float | decimal.Decimal | str, *, format_type
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if isinstance(number, str):
         number = decimal.Decimal(number)
@@ -583,21 +600,24 @@ def _get_compact_format(number: float | decimal.Decimal | str, compact_format: L
         number = decimal.Decimal(number)
 
     abs_number = abs(number)
-    log10 = int(math.log10(abs_number)) if abs_number != 0 else 0
-    magnitude = 10 ** max(0, log10)
-
     plural_form = locale.plural_form(abs_number)
     patterns = compact_format.get(plural_form, compact_format.get('other', {}))
 
-    for threshold in sorted(patterns.keys(), key=lambda x: int(x), reverse=True):
-        if abs_number >= int(threshold):
+    for magnitude, threshold in _sorted_thresholds(tuple(patterns)):
+        if abs_number >= magnitude:
             pattern = patterns[threshold]
             if isinstance(pattern, str):
-                pattern = parse_pattern(pattern)
-            return decimal.Decimal(threshold), pattern
+                pattern = _get_pattern(pattern)
+            return magnitude, pattern
 
     return decimal.Decimal('1'), None
 
+@lru_cache(maxsize=256)
+def _sorted_thresholds(thresholds: tuple[str, ...]) -> tuple[tuple[decimal.Decimal, str], ...]:
+    """Return ``(magnitude, threshold)`` pairs for the compact format
+    thresholds, largest first, with the magnitudes as exact decimals."""
+    return tuple(sorted(((decimal.Decimal(threshold), threshold) for threshold in thresholds), reverse=True))
+
 class UnknownCurrencyFormatError(KeyError):
     """Exception raised when an unknown currency format is requested."""
 
@@ -693,28 +713,70 @@ def format_currency(number: float | decimal.Decimal | str, currency: str, format
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if format_type == 'name':
         return _format_currency_long_name(number, currency, format, locale, currency_digits, decimal_quantization, group_separator, numbering_system)
 
-    try:
-        format = locale.currency_formats[format_type]
-    except KeyError:
-        raise UnknownCurrencyFormatError(f"'{format_type}' is not a known currency format type")
-
-    pattern = parse_pattern(format)
+    pattern = _get_currency_pattern(format, format_type, locale)
     return pattern.apply(number, locale, currency=currency, currency_digits=currency_digits,
                          decimal_quantization=decimal_quantization, group_separator=group_separator,
                          numbering_system=numbering_system)
 
+def format_currency_many(numbers: Iterable[float | decimal.Decimal | str], currency: str, format: str | NumberPattern | None=None, locale: Locale | str | None=LC_NUMERIC, currency_digits: bool=True, format_type: Literal['name', 'standard', 'accounting']='standard', decimal_quantization: bool=True, group_separator: bool=True, *, numbering_system: Literal['default'] | str='latn') -> list[str]:
+    """Return formatted currency values.
+
+    This gives the same results as calling `format_currency` on each number,
+    but the locale and the currency pattern are only resolved once, so it is
+    the preferred way of formatting many amounts in the same currency.
+
+    >>> format_currency_many([1099.98, 1], 'USD', locale='en_US')
+    ['$1,099.98', '$1.00']
+
+    See `format_currency` for the meaning of the other parameters.
+
+    :param numbers: the numbers to format
+    :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
+    """
+    locale = _get_locale(locale)
+
+    if format_type == 'name':
+        return [_format_currency_long_name(number, currency, format, locale, currency_digits, decimal_quantization, group_separator, numbering_system) for number in numbers]
+
+    pattern = _get_currency_pattern(format, format_type, locale)
+    apply = pattern.apply
+    return [apply(number, locale, currency=currency, currency_digits=currency_digits,
+                  decimal_quantization=decimal_quantization, group_separator=group_separator,
+                  numbering_system=numbering_system) for number in numbers]
+
+def _get_currency_pattern(format: str | NumberPattern | None, format_type: str, locale: Locale) -> NumberPattern:
+    if format:
+        return _get_pattern(format)
+    return _get_currency_format(locale, format_type)
+
+@lru_cache(maxsize=256)
+def _get_currency_format(locale: Locale, format_type: str) -> NumberPattern:
+    try:
+        return locale.currency_formats[format_type]
+    except KeyError:
+        raise UnknownCurrencyFormatError(f"'{format_type}' is not a known currency format type") from None
+
 def _format_currency_long_name(number, currency, format, locale, currency_digits, decimal_quantization, group_separator, numbering_system):
-    formatted_number = format_decimal(number, format=format, locale=locale, decimal_quantization=decimal_quantization,
-                                      group_separator=group_separator, numbering_system=numbering_system)
-    currency_name = get_currency_name(currency, count=number, locale=locale)
-    pattern = locale.currency_formats.get('name_pattern', '{0} {1}')
-    return pattern.format(formatted_number, currency_name)
+    # Algorithm described here:
+    # https://www.unicode.org/reports/tr35/tr35-numbers.html#Currencies
+
+    # Correct number to numeric type, important for looking up plural rules:
+    number_n = float(number) if isinstance(number, str) else number
+
+    unit_pattern = get_currency_unit_pattern(currency, count=number_n, locale=locale)
+    display_name = get_currency_name(currency, count=number_n, locale=locale)
+
+    pattern = _get_pattern(format) if format else locale.decimal_formats[None]
+    number_part = pattern.apply(number, locale, currency=currency, currency_digits=currency_digits,
+                                decimal_quantization=decimal_quantization, group_separator=group_separator,
+                                numbering_system=numbering_system)
+
+    return unit_pattern.format(number_part, display_name)
 
 def format_compact_currency(number: float | decimal.Decimal | str, currency: str, *, format_type: Literal['short']='short', locale: Locale | str | None=LC_NUMERIC, fraction_digits: int=0, numbering_system: Literal['default'] | str='latn') -> str:
     """Format a number as a currency value in compact form.
@@ -735,8 +797,7 @@ def format_compact_currency(number: float | decimal.Decimal | str, currency: str
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if isinstance(number, str):
         number = decimal.Decimal(number)
@@ -803,18 +864,13 @@ def format_percent(number: float | decimal.Decimal | str, format: str | NumberPa
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if format is None:
         format = locale.percent_formats[None]
-    if isinstance(format, str):
-        format = parse_pattern(format)
-
-    pattern = format.pattern.replace('#', '#/100')
-    custom_pattern = parse_pattern(pattern)
+    pattern = _get_pattern(format)
 
-    return custom_pattern.apply(
+    return pattern.apply(
         number,
         locale,
         decimal_quantization=decimal_quantization,
@@ -853,13 +909,12 @@ def format_scientific(number: float | decimal.Decimal | str, format: str | Numbe
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
     if format is None:
         format = locale.scientific_formats[None]
     if isinstance(format, str):
-        format = parse_pattern(format)
+        format = _get_pattern(format)
 
     return format.apply(
         number,
@@ -945,43 +1000,32 @@ def parse_decimal(string: str, locale: Locale | str | None=LC_NUMERIC, strict: b
                               decimal number
     :raise UnsupportedNumberingSystemError: if the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
 
-    if numbering_system == 'default':
-        numbering_system = locale.default_numbering_system
+    group_symbol, decimal_symbol = _get_separators(locale, numbering_system)
 
     try:
-        symbols = locale.number_symbols[numbering_system]
-    except KeyError:
-        raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
-
-    group_symbol = symbols['group']
-    decimal_symbol = symbols['decimal']
-
-    # Remove group separators
-    string = string.replace(group_symbol, '')
-
-    # Replace decimal separator with a dot
-    string = string.replace(decimal_symbol, '.')
-
-    # Remove any whitespace
-    string = string.strip()
-
-    try:
-        parsed = decimal.Decimal(string)
+        # Remove group separators, use a dot as decimal separator and drop
+        # surrounding whitespace
+        parsed = decimal.Decimal(string.replace(group_symbol, '').replace(decimal_symbol, '.').strip())
     except decimal.InvalidOperation:
-        raise NumberFormatError(f"'{string}' is not a valid decimal number")
-
-    if strict:
-        # Check if the original string matches the expected format
-        formatted = format_decimal(parsed, locale=locale, numbering_system=numbering_system)
-        if formatted != string:
-            suggestions = [
-                format_decimal(parsed, locale=locale, numbering_system=numbering_system),
-                format_decimal(parsed, locale=locale, numbering_system=numbering_system, decimal_quantization=False)
-            ]
-            raise NumberFormatError(f"'{string}' is not a properly formatted decimal number. Did you mean '{suggestions[0]}'? Or maybe '{suggestions[1]}'?")
+        raise NumberFormatError(f"'{string}' is not a valid decimal number") from None
+
+    if strict and group_symbol in string:
+        # Check if the original string matches the expected format; one
+        # formatted number is enough unless the check fails
+        proper = format_decimal(parsed, locale=locale, decimal_quantization=False, numbering_system=numbering_system)
+        if string != proper and proper != _remove_trailing_zeros_after_decimal(string, decimal_symbol):
+            try:
+                # Maybe the group and decimal symbols were swapped
+                parsed_alt = decimal.Decimal(string.replace(decimal_symbol, '').replace(group_symbol, '.'))
+            except decimal.InvalidOperation:
+                proper_alt = proper
+            else:
+                proper_alt = format_decimal(parsed_alt, locale=locale, decimal_quantization=False, numbering_system=numbering_system)
+            if proper_alt == proper:
+                raise NumberFormatError(f"'{string}' is not a properly formatted decimal number. Did you mean '{proper}'?", suggestions=[proper])
+            raise NumberFormatError(f"'{string}' is not a properly formatted decimal number. Did you mean '{proper}'? Or maybe '{proper_alt}'?", suggestions=[proper, proper_alt])
 
     return parsed
 
@@ -1036,50 +1080,50 @@ def parse_grouping(p: str) -> tuple[int, int]:
     >>> parse_grouping('#,####,###')
     (3, 4)
     """
-    width = len(p)
-    g1 = p.rfind(',')
-    if g1 == -1:
+    parts = p.rsplit(',', 2)
+    if len(parts) == 1:
         return 1000, 1000
-    g1 = width - g1 - 1
-    g2 = p[:-g1 - 1].rfind(',')
-    if g2 == -1:
+    g1 = len(parts[-1])
+    if len(parts) == 2:
         return g1, g1
-    g2 = width - g1 - g2 - 2
-    return g1, g2
+    return g1, len(parts[1])
+
+def _get_pattern(pattern: NumberPattern | str) -> NumberPattern:
+    """Like `parse_pattern`, but pattern strings are only parsed once.
+
+    Only for use by the formatting functions, which never modify the
+    `NumberPattern` objects they get; `parse_pattern` keeps returning new
+    instances.
+    """
+    if isinstance(pattern, NumberPattern):
+        return pattern
+    return _parse_pattern(pattern)
+
+@lru_cache(maxsize=512)
+def _parse_pattern(pattern: str) -> NumberPattern:
+    return parse_pattern(pattern)
 
 def parse_pattern(pattern: NumberPattern | str) -> NumberPattern:
     """Parse number format patterns"""
     if isinstance(pattern, NumberPattern):
         return pattern
 
-    # Parse the pattern string
+    def _match_number(pattern):
+        rv = number_re.search(pattern)
+        if rv is None:
+            raise ValueError(f"Invalid number pattern {pattern!r}")
+        return rv.groups()
+
+    # Split each subpattern into prefix, number and suffix with one match
     if ';' in pattern:
-        positive, negative = pattern.split(';')
-    else:
-        positive = pattern
-        negative = ''
-
-    # Extract prefix and suffix
-    def extract_affix(pattern):
-        prefix = suffix = ''
-        for part in number_re.split(pattern):
-            if part and part.find('0') == -1 and part.find('#') == -1 and part.find(',') == -1 and part.find('.') == -1 and part.find('E') == -1:
-                if prefix:
-                    suffix = part
-                else:
-                    prefix = part
-        return prefix, suffix
-
-    pos_prefix, pos_suffix = extract_affix(positive)
-    if negative:
-        neg_prefix, neg_suffix = extract_affix(negative)
+        positive, negative = pattern.split(';', 1)
+        pos_prefix, number, pos_suffix = _match_number(positive)
+        neg_prefix, _, neg_suffix = _match_number(negative)
     else:
+        pos_prefix, number, pos_suffix = _match_number(pattern)
         neg_prefix = '-' + pos_prefix
         neg_suffix = pos_suffix
 
-    # Extract number format
-    number = number_re.search(positive).group('number')
-
     # Parse grouping
     if ',' in number:
         integer, _, fraction = number.partition('.')
@@ -1115,6 +1159,10 @@ def parse_pattern(pattern: NumberPattern | str) -> NumberPattern:
     return NumberPattern(pattern, (pos_prefix, neg_prefix), (pos_suffix, neg_suffix),
                          grouping, int_prec, fraction_prec, exp_prec, exp_plus, number)
 
+#: Factors for `NumberPattern.scale`, so percent and permille values do not
+#: need a fresh `Decimal` for every multiplication
+_SCALE_FACTORS = {2: decimal.Decimal(100), 3: decimal.Decimal(1000)}
+
 class NumberPattern:
 
     def __init__(self, pattern: str, prefix: tuple[str, str], suffix: tuple[str, str], grouping: tuple[int, int], int_prec: tuple[int, int], frac_prec: tuple[int, int], exp_prec: tuple[int, int] | None, exp_plus: bool | None, number_pattern: str | None=None) -> None:
@@ -1139,34 +1187,25 @@ class NumberPattern:
         detected in the prefix or suffix of the pattern. Default is to not mess
         with the scale at all and keep it to 0.
         """
-        if '%' in ''.join(self.prefix + self.suffix):
+        affixes = ''.join(self.prefix + self.suffix)
+        if '%' in affixes:
             return 2
-        elif '‰' in ''.join(self.prefix + self.suffix):
+        elif '‰' in affixes:
             return 3
         return 0
 
     def scientific_notation_elements(self, value: decimal.Decimal, locale: Locale | str | None, *, numbering_system: Literal['default'] | str='latn') -> tuple[decimal.Decimal, int, str]:
         """ Returns normalized scientific notation components of a value.
         """
-        if isinstance(locale, str):
-            locale = Locale.parse(locale)
+        locale = _get_locale(locale)
 
-        if numbering_system == 'default':
-            numbering_system = locale.default_numbering_system
-
-        try:
-            exp_symbol = locale.number_symbols[numbering_system]['exponential']
-        except KeyError:
-            raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
+        exp_symbol = _get_number_symbols(locale, numbering_system).get('exponential', 'E')
 
         exponent = 0
         if value != 0:
-            while value >= 10 or value <= -10:
-                exponent += 1
-                value /= 10
-            while value < 1 and value > -1:
-                exponent -= 1
-                value *= 10
+            # Normalize value to only have one lead digit
+            exponent = value.adjusted()
+            value = value.scaleb(-exponent)
 
         return value, exponent, exp_symbol
 
@@ -1199,70 +1238,72 @@ class NumberPattern:
         :rtype: str
         :raise UnsupportedNumberingSystemError: If the numbering system is not supported by the locale.
         """
-        if isinstance(locale, str):
-            locale = Locale.parse(locale)
-
-        if isinstance(value, str):
-            value = decimal.Decimal(value)
-        elif not isinstance(value, decimal.Decimal):
-            value = decimal.Decimal(str(value))
-
-        is_negative = value < 0
-        if self.scale:
-            value = value * (10 ** self.scale)
+        locale = _get_locale(locale)
 
         if currency and currency_digits:
-            frac_prec = (get_currency_precision(currency), get_currency_precision(currency))
+            precision = get_currency_precision(currency)
+            frac_prec = (precision, precision)
         elif force_frac:
             frac_prec = force_frac
         else:
             frac_prec = self.frac_prec
 
-        if decimal_quantization:
-            quantum = get_decimal_quantum(frac_prec[1])
-            value = value.quantize(quantum)
-
-        if numbering_system == 'default':
-            numbering_system = locale.default_numbering_system
-
-        try:
-            symbols = locale.number_symbols[numbering_system]
-        except KeyError:
-            raise UnsupportedNumberingSystemError(f"Numbering system '{numbering_system}' is not supported for locale '{locale}'")
-
-        value = abs(value)
-        a, sep, b = f"{value:.{frac_prec[1]}f}".partition(".")
-
-        if group_separator:
-            a = self._format_int_part(a, self.grouping, symbols['group'])
+        group_symbol, decimal_symbol = _get_separators(locale, numbering_system)
 
-        if b:
-            b = b.rstrip('0')[:frac_prec[1]]
+        if isinstance(value, int) and not isinstance(value, bool) and not frac_prec[0] and not self.exp_prec and '@' not in self.pattern:
+            # Integers have no fraction digits to quantize or strip
+            is_negative = value < 0
+            a = str(abs(value) * 10 ** self.scale)
+            b = ''
+        else:
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(value if isinstance(value, str) else str(value))
+
+            is_negative = value < 0
+            if self.scale:
+                value = value * _SCALE_FACTORS[self.scale]
+
+            if decimal_quantization:
+                value = value.quantize(_get_quantum(frac_prec[1]))
+
+            value = abs(value)
+            # A quantized value usually prints with exactly the wanted
+            # fraction digits already, which is much cheaper than formatting
+            number = str(value)
+            a, sep, b = number.partition(".")
+            if len(b) != frac_prec[1] or 'E' in number:
+                a, sep, b = f"{value:.{frac_prec[1]}f}".partition(".")
+
+            # Drop trailing zeros, but keep the pattern's minimum fraction digits
+            b = b.rstrip('0').ljust(frac_prec[0], '0')[:frac_prec[1]]
             if b:
-                b = symbols['decimal'] + b
-
-        number = a + b
+                b = decimal_symbol + b
 
-        retval = ''
-        if is_negative:
-            retval += self.prefix[1]
-        else:
-            retval += self.prefix[0]
+        if group_separator:
+            a = self._format_int_part(a, self.grouping, group_symbol)
 
-        retval += number
+        retval = self.prefix[is_negative] + a + b + self.suffix[is_negative]
 
-        if is_negative:
-            retval += self.suffix[1]
-        else:
-            retval += self.suffix[0]
+        if currency is not None and '¤' in retval:
+            retval = retval.replace('¤¤¤', get_currency_name(currency, value, locale))
+            retval = retval.replace('¤¤', currency.upper())
+            retval = retval.replace('¤', get_currency_symbol(currency, locale))
 
         return retval
 
     def _format_int_part(self, value: str, grouping: tuple[int, int], group_symbol: str) -> str:
-        """Format the integer part of a number with grouping."""
-        result = ''
-        for i, digit in enumerate(reversed(value)):
-            if i != 0 and i % grouping[0] == 0:
-                result = group_symbol + result
-            result = digit + result
-        return result
+        """Format the integer part of a number with grouping.
+
+        The last group has the primary size, all others the secondary size.
+        """
+        size, secondary = grouping
+        if len(value) <= size:
+            return value
+        parts = []
+        end = len(value)
+        while end > size:
+            parts.append(value[end - size:end])
+            end -= size
+            size = secondary
+        parts.append(value[:end])
+        return group_symbol.join(reversed(parts))
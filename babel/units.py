@@ -1,8 +1,9 @@
 from __future__ import annotations
 import decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from babel.core import Locale
-from babel.numbers import LC_NUMERIC, format_decimal
+from babel.numbers import LC_NUMERIC, _get_locale, format_decimal
 if TYPE_CHECKING:
     from typing_extensions import Literal
 
@@ -33,14 +34,15 @@ def get_unit_name(measurement_unit: str, length: Literal['short', 'long', 'narro
     :param locale: the `Locale` object or locale identifier
     :return: The unit display name, or None.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
+    unit = _get_unit_pattern_key(measurement_unit, locale)
+    if not unit:
+        raise UnknownUnitError(unit=measurement_unit, locale=locale)
+    return _get_unit_display_name(unit, length, locale)
 
-    unit_data = locale.unit_display_names.get(measurement_unit)
-    if unit_data is None:
-        raise UnknownUnitError(f"{measurement_unit}/{length} is not a known unit/length in {locale}")
-
-    return unit_data.get(length)
+def _get_unit_display_name(unit: str, length: str, locale: Locale) -> str | None:
+    """Return the display name of the qualified `unit` in the given length."""
+    return locale._data['unit_display_names'].get(unit, {}).get(length)
 
 def _find_unit_pattern(unit_id: str, locale: Locale | str | None=LC_NUMERIC) -> str | None:
     """
@@ -59,12 +61,19 @@ def _find_unit_pattern(unit_id: str, locale: Locale | str | None=LC_NUMERIC) ->
     :param unit_id: the code of a measurement unit.
     :return: A key to the `unit_patterns` mapping, or None.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    for category in locale.unit_display_names:
-        if unit_id in locale.unit_display_names[category]:
-            return f"{category}-{unit_id}"
+    locale = _get_locale(locale)
+    return _get_unit_pattern_key(unit_id, locale)
+
+@lru_cache(maxsize=1024)
+def _get_unit_pattern_key(unit_id: str, locale: Locale) -> str | None:
+    """Cached implementation of `_find_unit_pattern`; the scan over all
+    unit patterns of the locale only happens once per unit and locale."""
+    unit_patterns = locale._data['unit_patterns']
+    if unit_id in unit_patterns:
+        return unit_id
+    for unit_pattern in sorted(unit_patterns, key=len):
+        if unit_pattern.endswith(unit_id):
+            return unit_pattern
     return None
 
 def format_unit(value: str | float | decimal.Decimal, measurement_unit: str, length: Literal['short', 'long', 'narrow']='long', format: str | None=None, locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str:
@@ -119,26 +128,41 @@ def format_unit(value: str | float | decimal.Decimal, measurement_unit: str, len
                              The special value "default" will use the default numbering system of the locale.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    unit_pattern = _find_unit_pattern(measurement_unit, locale)
-    if unit_pattern is None:
-        raise UnknownUnitError(f"{measurement_unit} is not a known unit in {locale}")
+    locale = _get_locale(locale)
 
-    unit_name = get_unit_name(unit_pattern, length, locale)
-    if unit_name is None:
-        raise UnknownUnitError(f"{measurement_unit}/{length} is not a known unit/length in {locale}")
+    unit_patterns = _get_unit_patterns(measurement_unit, length, locale)
+    if unit_patterns is None:
+        raise UnknownUnitError(unit=measurement_unit, locale=locale)
 
-    if isinstance(value, str):
+    if isinstance(value, str):  # Assume the value is a preformatted singular.
         formatted_value = value
+        plural_form = "one"
     else:
-        formatted_value = format_decimal(value, format=format, locale=locale, numbering_system=numbering_system)
-
-    plural_form = locale.plural_form(value)
-    unit_pattern = locale.unit_display_names[unit_pattern][length][plural_form]
-
-    return unit_pattern.format(formatted_value, unit_name)
+        formatted_value = format_decimal(value, format, locale, numbering_system=numbering_system)
+        plural_form = locale.plural_form(value)
+
+    if plural_form in unit_patterns:
+        return unit_patterns[plural_form].format(formatted_value)
+
+    # Fall back to a somewhat bad representation.
+    # nb: This is marked as no-cover, as the current CLDR seemingly has no way for this to happen.
+    q_unit = _get_unit_pattern_key(measurement_unit, locale)  # pragma: no cover
+    fallback_name = _get_unit_display_name(q_unit, length, locale)  # pragma: no cover
+    return f"{formatted_value} {fallback_name or measurement_unit}"  # pragma: no cover
+
+@lru_cache(maxsize=1024)
+def _get_unit_patterns(measurement_unit: str, length: str, locale: Locale) -> dict[str, str] | None:
+    """Return the patterns of a unit in the given length, by plural form, or
+    None if the unit is unknown.
+
+    The unit is qualified and its patterns are resolved only once per unit,
+    length and locale, so `format_unit` needs no further lookups.  The
+    returned dictionary is shared and must not be modified.
+    """
+    q_unit = _get_unit_pattern_key(measurement_unit, locale)
+    if not q_unit:
+        return None
+    return dict(locale._data['unit_patterns'][q_unit].get(length, {}))
 
 def _find_compound_unit(numerator_unit: str, denominator_unit: str, locale: Locale | str | None=LC_NUMERIC) -> str | None:
     """
@@ -164,16 +188,29 @@ def _find_compound_unit(numerator_unit: str, denominator_unit: str, locale: Loca
     :return: A key to the `unit_patterns` mapping, or None.
     :rtype: str|None
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
-
-    for category, units in locale.unit_display_names.items():
-        for unit, data in units.items():
-            if '-per-' in unit:
-                num, den = unit.split('-per-')
-                if num == numerator_unit and den == denominator_unit:
-                    return f"{category}-{unit}"
-    return None
+    locale = _get_locale(locale)
+    return _get_compound_unit_key(numerator_unit, denominator_unit, locale)
+
+def _get_compound_unit_key(numerator_unit: str, denominator_unit: str, locale: Locale) -> str | None:
+    """Implementation of `_find_compound_unit` for an already parsed `Locale`."""
+    # Qualify the numerator and denominator units.  This will turn possibly partial
+    # units like "kilometer" or "hectare" into fully qualified ones like "length-kilometer"
+    # and "area-hectare".
+    resolved_numerator_unit = _get_unit_pattern_key(numerator_unit, locale)
+    resolved_denominator_unit = _get_unit_pattern_key(denominator_unit, locale)
+
+    # If either was not found, we can't possibly build a suitable compound unit either.
+    if not (resolved_numerator_unit and resolved_denominator_unit):
+        return None
+
+    # Since compound units are named "speed-kilometer-per-hour", we'll have to slice off
+    # the quantities (i.e. "length", "duration") from both qualified units.
+    bare_numerator_unit = resolved_numerator_unit.split("-", 1)[-1]
+    bare_denominator_unit = resolved_denominator_unit.split("-", 1)[-1]
+
+    # Now we can try and rebuild a compound unit specifier, then qualify it;
+    # both lookups are cached, so no unit patterns are scanned here.
+    return _get_unit_pattern_key(f"{bare_numerator_unit}-per-{bare_denominator_unit}", locale)
 
 def format_compound_unit(numerator_value: str | float | decimal.Decimal, numerator_unit: str | None=None, denominator_value: str | float | decimal.Decimal=1, denominator_unit: str | None=None, length: Literal['short', 'long', 'narrow']='long', format: str | None=None, locale: Locale | str | None=LC_NUMERIC, *, numbering_system: Literal['default'] | str='latn') -> str | None:
     """
@@ -226,16 +263,50 @@ def format_compound_unit(numerator_value: str | float | decimal.Decimal, numerat
     :return: A formatted compound value.
     :raise `UnsupportedNumberingSystemError`: If the numbering system is not supported by the locale.
     """
-    if isinstance(locale, str):
-        locale = Locale.parse(locale)
+    locale = _get_locale(locale)
+
+    # Look for a specific compound unit first...
 
-    if numerator_unit and denominator_unit:
-        compound_unit = _find_compound_unit(numerator_unit, denominator_unit, locale)
+    if numerator_unit and denominator_unit and denominator_value == 1:
+        compound_unit = _get_compound_unit_key(numerator_unit, denominator_unit, locale)
         if compound_unit:
             return format_unit(numerator_value, compound_unit, length, format, locale, numbering_system=numbering_system)
 
-    numerator = format_unit(numerator_value, numerator_unit, length, format, locale, numbering_system=numbering_system) if numerator_unit else str(numerator_value)
-    denominator = format_unit(denominator_value, denominator_unit, length, format, locale, numbering_system=numbering_system) if denominator_unit else str(denominator_value)
-
-    per_pattern = locale.unit_display_names.get('per', {}).get(length, '{0}/{1}')
-    return per_pattern.format(numerator, denominator)
+    # ... failing that, construct one "by hand".
+
+    if isinstance(numerator_value, str):  # Numerator is preformatted
+        formatted_numerator = numerator_value
+    elif numerator_unit:  # Numerator has unit
+        formatted_numerator = format_unit(numerator_value, numerator_unit, length, format, locale, numbering_system=numbering_system)
+    else:  # Unitless numerator
+        formatted_numerator = format_decimal(numerator_value, format, locale, numbering_system=numbering_system)
+
+    if isinstance(denominator_value, str):  # Denominator is preformatted
+        formatted_denominator = denominator_value
+    elif denominator_unit:  # Denominator has unit
+        if denominator_value == 1:  # support perUnitPatterns when the denominator is 1
+            unit_patterns = _get_unit_patterns(denominator_unit, length, locale)
+            per_pattern = unit_patterns.get("per") if unit_patterns else None
+            if per_pattern:
+                return per_pattern.format(formatted_numerator)
+            denominator_unit = _get_unit_pattern_key(denominator_unit, locale)
+            # See TR-35's per-unit pattern algorithm, point 3.2.
+            # For denominator 1, we replace the value to be formatted with the empty string;
+            # this will make `format_unit` return " second" instead of "1 second".
+            denominator_value = ""
+
+        formatted_denominator = format_unit(denominator_value, denominator_unit or "", length, format, locale, numbering_system=numbering_system).strip()
+    else:  # Bare denominator
+        formatted_denominator = format_decimal(denominator_value, format, locale, numbering_system=numbering_system)
+
+    return _get_per_pattern(length, locale).format(formatted_numerator, formatted_denominator)
+
+@lru_cache(maxsize=64)
+def _get_per_pattern(length: str, locale: Locale) -> str:
+    """Return the locale's generic pattern for combining a numerator and a
+    denominator, such as ``{0} per {1}``, resolved once per length and locale.
+
+    The ``compound_variations`` and ``prefix`` forms of the pattern are not
+    supported; locales that only provide those get ``{0}/{1}``.
+    """
+    return locale._data["compound_unit_patterns"].get("per", {}).get(length, {}).get("compound", "{0}/{1}")
@@ -14,7 +14,8 @@ import datetime
 import os
 import re
 import textwrap
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
+from functools import lru_cache
 from typing import IO, Any, TypeVar
 from babel import dates, localtime
 missing = object()
@@ -38,6 +39,9 @@ def distinct(iterable: Iterable[_T]) -> Generator[_T, None, None]:
         if item not in seen:
             seen.add(item)
             yield item
+#: Number of bytes `parse_encoding` reads at once, enough for the first two
+#: lines of virtually all source files.
+_ENCODING_PROBE_SIZE = 512
 PYTHON_MAGIC_COMMENT_re = re.compile(b'[ \\t\\f]* \\# .* coding[=:][ \\t]*([-\\w.]+)', re.VERBOSE)
 
 def parse_encoding(fp: IO[bytes]) -> str | None:
@@ -54,39 +58,73 @@ def parse_encoding(fp: IO[bytes]) -> str | None:
     pos = fp.tell()
     fp.seek(0)
     try:
-        line1 = fp.readline()
-        if line1 and line1.startswith(b'\xef\xbb\xbf'):
+        head = fp.read(_ENCODING_PROBE_SIZE)
+        # Only continue reading if the first two lines are longer than that
+        for _ in range(2 - head.count(b'\n')):
+            head += fp.readline()
+        line1, _, line2 = head.partition(b'\n')
+        line2 = line2.split(b'\n', 1)[0]
+        has_bom = line1.startswith(codecs.BOM_UTF8)
+        if has_bom:
+            line1 = line1[len(codecs.BOM_UTF8):]
+
+        m = PYTHON_MAGIC_COMMENT_re.match(line1)
+        if not m:
+            try:
+                import ast
+                ast.parse(line1.decode('latin-1'))
+            except (ImportError, SyntaxError, UnicodeEncodeError):
+                # Either it's a real syntax error, in which case the source is
+                # not valid python source, or line2 is a continuation of line1,
+                # in which case we don't want to scan line2 for a magic
+                # comment.
+                pass
+            else:
+                m = PYTHON_MAGIC_COMMENT_re.match(line2)
+
+        if has_bom:
+            if m:
+                magic_comment_encoding = m.group(1).decode('latin-1')
+                if magic_comment_encoding != 'utf-8':
+                    raise SyntaxError(f"encoding problem: {magic_comment_encoding} with BOM")
             return 'utf-8'
-        line2 = fp.readline()
-        for line in (line1, line2):
-            match = PYTHON_MAGIC_COMMENT_re.search(line)
-            if match:
-                return match.group(1).decode('ascii')
+        elif m:
+            return m.group(1).decode('latin-1')
+        else:
+            return None
     finally:
         fp.seek(pos)
-    return None
-PYTHON_FUTURE_IMPORT_re = re.compile('from\\s+__future__\\s+import\\s+\\(*(.+)\\)*')
+PYTHON_FUTURE_IMPORT_re = re.compile(b'from\\s+__future__\\s+import\\s+\\(*(.+)\\)*')
 
 def parse_future_flags(fp: IO[bytes], encoding: str='latin-1') -> int:
     """Parse the compiler flags by :mod:`__future__` from the given Python
     code.
     """
     import __future__
-    flags = 0
     pos = fp.tell()
     fp.seek(0)
+    flags = 0
     try:
-        for line in fp:
-            if line.strip().startswith(b'#'):
-                continue
-            match = PYTHON_FUTURE_IMPORT_re.search(line.decode(encoding))
-            if match:
-                names = match.group(1).split(',')
-                for name in names:
-                    flag = getattr(__future__, name.strip().replace(' ', '_'))
-                    flags |= flag.compiler_flag
-            elif not line.startswith(b'from __future__'):
-                break
+        body = fp.read()
+
+        # Fix up the source to be (hopefully) parsable by regexpen.
+        # This will likely do untoward things if the source code itself is broken.
+
+        # (1) Fix `import (\n...` to be `import (...`.
+        body = re.sub(rb'import\s*\([\r\n]+', b'import (', body)
+        # (2) Join line-ending commas with the next line.
+        body = re.sub(rb',\s*[\r\n]+', b', ', body)
+        # (3) Remove backslash line continuations.
+        body = re.sub(rb'\\\s*[\r\n]+', b' ', body)
+
+        # Only the imported names are decoded; the rest of the source is
+        # matched as bytes.
+        for m in PYTHON_FUTURE_IMPORT_re.finditer(body):
+            names = [x.strip().strip('()') for x in m.group(1).decode(encoding).split(',')]
+            for name in names:
+                feature = getattr(__future__, name, None)
+                if feature:
+                    flags |= feature.compiler_flag
     finally:
         fp.seek(pos)
     return flags
@@ -129,36 +167,57 @@ def pathmatch(pattern: str, filename: str) -> bool:
     :param pattern: the glob pattern
     :param filename: the path name of the file to match against
     """
-    import fnmatch
-    import os.path
+    return _compile_pathmatch(pattern)(filename.replace(os.path.sep, '/'))
+
+#: Regex equivalents of the wildcards supported by `pathmatch`.
+_PATHMATCH_SYMBOLS = {
+    '?': '[^/]',
+    '?/': '[^/]/',
+    '*': '[^/]+',
+    '*/': '[^/]+/',
+    '**/': '(?:.+/)*?',
+    '**': '(?:.+/)*?[^/]+',
+}
 
+@lru_cache(maxsize=None)
+def _compile_pathmatch(pattern: str) -> Callable[[str], bool]:
+    """Compile a `pathmatch` pattern into a function matching ``/``-separated
+    path names, so extracting from many files does not prepare the same
+    pattern over and over again.
+
+    Patterns without wildcards are compared for equality, and patterns like
+    ``**.py`` are checked with `str.endswith`; only other patterns are
+    translated to a regular expression.
+    """
     pattern = pattern.replace(os.path.sep, '/')
-    filename = filename.replace(os.path.sep, '/')
 
     if pattern.startswith('^'):
         pattern = pattern[1:]
-    else:
-        pattern = '*/' + pattern
-
-    if '**' in pattern:
-        parts = pattern.split('**')
-        for idx, part in enumerate(parts):
-            if idx == 0:
-                if not filename.startswith(part):
-                    return False
-                filename = filename[len(part):]
-            elif idx == len(parts) - 1:
-                if not filename.endswith(part):
-                    return False
-                filename = filename[:-len(part)]
-            else:
-                pos = filename.find(part)
-                if pos < 0:
-                    return False
-                filename = filename[pos + len(part):]
-        return True
-    else:
-        return fnmatch.fnmatch(filename, pattern)
+    elif pattern.startswith('./'):
+        pattern = pattern[2:]
+
+    if '*' not in pattern and '?' not in pattern:
+        return lambda filename: filename == pattern
+
+    suffix = pattern[2:]
+    if pattern.startswith('**') and not any(char in suffix for char in '*?/'):
+        # A file name with the given ending, in any directory
+        def match_suffix(filename: str) -> bool:
+            if not filename.endswith(suffix):
+                return False
+            head = filename[:len(filename) - len(suffix)]
+            sep = head.rfind('/')
+            return sep != 0 and sep < len(head) - 1
+        return match_suffix
+
+    buf = []
+    for idx, part in enumerate(re.split('([?*]+/?)', pattern)):
+        if idx % 2:
+            buf.append(_PATHMATCH_SYMBOLS[part])
+        elif part:
+            buf.append(re.escape(part))
+    regex = re.compile(f"{''.join(buf)}$")
+    return lambda filename: regex.match(filename) is not None
 
 class TextWrapper(textwrap.TextWrapper):
     wordsep_re = re.compile('(\\s+|(?<=[\\w\\!\\"\\\'\\&\\.\\,\\?])-{2,}(?=\\w))')
@@ -174,11 +233,18 @@ def wraptext(text: str, width: int=70, initial_indent: str='', subsequent_indent
     :param subsequent_indent: string that will be prepended to all lines save
                               the first of wrapped output
     """
-    wrapper = TextWrapper(width=width,
-                          initial_indent=initial_indent,
-                          subsequent_indent=subsequent_indent,
-                          break_long_words=False)
-    return wrapper.wrap(text)
+    return _get_wrapper(width, initial_indent, subsequent_indent).wrap(text)
+
+@lru_cache(maxsize=32)
+def _get_wrapper(width: int, initial_indent: str, subsequent_indent: str) -> TextWrapper:
+    """Return a shared `TextWrapper` for the given settings, so catalogs with
+    many wrapped lines do not set up a new one for each.  Wrapping keeps no
+    state between calls, so the instances can be reused safely.
+    """
+    return TextWrapper(width=width,
+                       initial_indent=initial_indent,
+                       subsequent_indent=subsequent_indent,
+                       break_long_words=False)
 odict = collections.OrderedDict
 
 class FixedOffsetTimezone(datetime.tzinfo):
@@ -195,6 +261,15 @@ class FixedOffsetTimezone(datetime.tzinfo):
 
     def __repr__(self) -> str:
         return f'<FixedOffset "{self.zone}" {self._offset}>'
+
+    def utcoffset(self, dt: datetime.datetime) -> datetime.timedelta:
+        return self._offset
+
+    def tzname(self, dt: datetime.datetime) -> str:
+        return self.zone
+
+    def dst(self, dt: datetime.datetime) -> datetime.timedelta:
+        return ZERO
 UTC = dates.UTC
 LOCALTZ = dates.LOCALTZ
 get_localzone = localtime.get_localzone
@@ -39,6 +39,12 @@ class MessageTestCase(unittest.TestCase):
         assert catalog.PYTHON_FORMAT.search('foo %(name)*.*f')
         assert catalog.PYTHON_FORMAT.search('foo %()s')
 
+    def test_python_format_placeholders(self):
+        mess = catalog.Message('foo %(name)s %d')
+        assert mess.python_format_placeholders == ((('name', 's'), (None, 'd')),)
+        mess.id = ('%d foo', '%(count)d foos')
+        assert mess.python_format_placeholders == (((None, 'd'),), (('count', 'd'),))
+
     def test_translator_comments(self):
         mess = catalog.Message('foo', user_comments=['Comment About `foo`'])
         assert mess.user_comments == ['Comment About `foo`']
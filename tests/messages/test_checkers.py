@@ -14,10 +14,13 @@ import unittest
 from datetime import datetime
 from io import BytesIO
 
+import pytest
+
 from babel import __version__ as VERSION
 from babel.core import Locale, UnknownLocaleError
 from babel.dates import format_datetime
 from babel.messages import checkers
+from babel.messages.catalog import Catalog, Message, TranslationError
 from babel.messages.plurals import PLURALS
 from babel.messages.pofile import read_po
 from babel.util import LOCALTZ
@@ -325,3 +328,22 @@ msgstr[4] ""
             catalog = read_po(BytesIO(po_file), _locale)
             message = catalog['foobar']
             checkers.num_plurals(catalog, message)
+
+
+def test_validate_catalog():
+    catalog = Catalog(locale='de')
+    catalog.add('good %s', 'gut %s', flags=['python-format'])
+    catalog.add('bad %s', 'schlecht %(name)s', flags=['python-format'])
+    catalog.add(('item', 'items'), ('Artikel',))
+    catalog.add(('file', 'files'), ('Datei', 'Dateien'))
+    failures = {message.id: errors for message, errors in checkers.validate_catalog(catalog)}
+    assert set(failures) == {'bad %s', ('item', 'items')}
+    assert all(len(errors) == 1 for errors in failures.values())
+
+
+def test_python_format_plurals():
+    message = Message(('%d file', '%d files'), ('%d Datei', '%d Dateien', ''), flags=['python-format'])
+    checkers.python_format(None, message)
+    message = Message(('%d file', '%d files'), ('%d Datei', '%s Dateien'), flags=['python-format'])
+    with pytest.raises(TranslationError):
+        checkers.python_format(None, message)
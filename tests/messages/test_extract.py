@@ -11,6 +11,7 @@
 # history and logs, available at http://babel.edgewall.org/log/.
 
 import codecs
+import os
 import sys
 import unittest
 from io import BytesIO, StringIO
@@ -18,6 +19,7 @@ from io import BytesIO, StringIO
 import pytest
 
 from babel.messages import extract
+from tests.messages.consts import project_dir
 
 
 class ExtractPythonTestCase(unittest.TestCase):
@@ -513,6 +515,25 @@ msg = _('')
         finally:
             sys.stderr = stderr
 
+    def test_extract_applies_keyword_specs(self):
+        buf = BytesIO(b"""
+msg1 = pgettext('ctx', 'Message')
+msg2 = npgettext('ctx', 'One', 'Many', n)
+msg3 = dngettext('domain', 'Apple', 'Apples', n)
+msg4 = custom('Hello')
+msg5 = custom('hello', 'There', 'Theres')
+msg6 = custom('too', 'many', 'args', 'here')
+""")
+        keywords = dict(extract.DEFAULT_KEYWORDS, custom={1: None, 3: (2, 3)})
+        messages = list(extract.extract('python', buf, keywords))
+        assert messages == [
+            (2, 'Message', [], 'ctx'),
+            (3, ('One', 'Many'), [], 'ctx'),
+            (4, ('Apple', 'Apples'), [], None),
+            (5, 'Hello', [], None),
+            (6, ('There', 'Theres'), [], None),
+        ]
+
     def test_extract_allows_callable(self):
         def arbitrary_extractor(fileobj, keywords, comment_tags, options):
             return [(1, None, (), ())]
@@ -555,3 +576,50 @@ t2 = _(f'\xe5\xe4\xf6' f'\xc5\xc4\xd6')
         messages = list(extract.extract('python', buf, extract.DEFAULT_KEYWORDS, [], {}))
         assert len(messages) == 1
         assert messages[0][1] == 'åäöÅÄÖ'
+
+
+def test_extract_from_dir_parallel(monkeypatch):
+    monkeypatch.setattr(extract, '_MIN_PARALLEL_JOBS', 0)
+    serial = list(extract.extract_from_dir(project_dir))
+    parallel = list(extract.extract_from_dir(project_dir, max_workers=2))
+    assert serial
+    assert parallel == serial
+
+
+def test_extract_from_dir_prunes_filtered_directories():
+    visited = []
+
+    def directory_filter(dirpath):
+        visited.append(os.path.relpath(dirpath, project_dir))
+        return os.path.basename(dirpath) != 'ignored'
+
+    filenames = [filename for filename, *_ in extract.extract_from_dir(project_dir, directory_filter=directory_filter)]
+    assert 'ignored' in visited
+    # Files in accepted directories are still extracted from
+    assert {'file1.py', 'file2.py'} <= set(filenames)
+    # Nothing beneath the rejected directory is walked into or extracted from
+    assert not any(path.startswith(f'ignored{os.sep}') for path in visited + filenames)
+
+
+def test_default_directory_filter():
+    assert extract.default_directory_filter(os.path.join('project', 'templates'))
+    assert not extract.default_directory_filter(os.path.join('project', '.git'))
+    assert not extract.default_directory_filter(os.path.join('project', '_hidden_by_default'))
+
+
+def test_method_map_suffixes():
+    assert extract._method_map_suffixes([('**.py', 'python'), ('**.js', 'javascript')]) == ('.py', '.js')
+    assert extract._method_map_suffixes([('**.py', 'python'), ('**/templates/**.html', 'genshi')]) is None
+    assert extract._method_map_suffixes([('**', 'python')]) is None
+    assert extract._method_map_suffixes([]) is None
+
+
+def test_find_extraction_method_options_not_shared():
+    method_map = [('**.py', 'python')]
+    options_map = {'**.py': {'encoding': 'latin-1'}}
+    options_cache = {}
+    _, first = extract._find_extraction_method('a.py', method_map, options_map, options_cache)
+    first['encoding'] = 'utf-8'
+    _, second = extract._find_extraction_method('b.py', method_map, options_map, options_cache)
+    assert second == {'encoding': 'latin-1'}
+    assert options_map['**.py'] == {'encoding': 'latin-1'}
@@ -6,6 +6,8 @@ def test_unquote():
     assert jslexer.unquote_string(r'"h\u00ebllo"') == "hëllo"
     assert jslexer.unquote_string(r'"h\xebllo"') == "hëllo"
     assert jslexer.unquote_string(r'"\xebb"') == "ëb"
+    assert jslexer.unquote_string(r'"\u00e"') == "u00e"
+    assert jslexer.unquote_string(r"'it\'s \\ \q\t'") == "it's \\ q\t"
 
 
 def test_dollar_in_identifier():
@@ -123,3 +125,26 @@ def test_jsx():
         ('jsx_tag', '</comp2', 8),
         ('operator', '>', 8),
     ]
+
+
+def test_division_and_regexp():
+    assert list(jslexer.tokenize("a = (b) / c / d; e = /x\\/y/g.test(f)")) == [
+        ('name', 'a', 1),
+        ('operator', '=', 1),
+        ('operator', '(', 1),
+        ('name', 'b', 1),
+        ('operator', ')', 1),
+        ('operator', '/', 1),
+        ('name', 'c', 1),
+        ('operator', '/', 1),
+        ('name', 'd', 1),
+        ('operator', ';', 1),
+        ('name', 'e', 1),
+        ('operator', '=', 1),
+        ('regexp', '/x\\/y/g', 1),
+        ('operator', '.', 1),
+        ('name', 'test', 1),
+        ('operator', '(', 1),
+        ('name', 'f', 1),
+        ('operator', ')', 1),
+    ]
@@ -11,6 +11,7 @@
 # history and logs, available at http://babel.edgewall.org/log/.
 
 import os
+import struct
 import unittest
 from io import BytesIO
 
@@ -34,6 +35,34 @@ class ReadMoTestCase(unittest.TestCase):
             assert catalog['bar'].string == 'Stange'
             assert catalog['foobar'].string == ['Fuhstange', 'Fuhstangen']
 
+    def test_file_and_buffer(self):
+        mo_path = os.path.join(self.datadir, 'project', 'i18n', 'de',
+                               'LC_MESSAGES', 'messages.mo')
+        with open(mo_path, 'rb') as mo_file:
+            mapped = mofile.read_mo(mo_file)
+            mo_file.seek(0)
+            data = mo_file.read()
+        read = mofile.read_mo(BytesIO(data))
+        # Not at the start of the file, so it cannot be mapped
+        buf = BytesIO(b'junk' + data)
+        buf.seek(4)
+        offset = mofile.read_mo(buf)
+        for catalog in (read, offset):
+            assert [(m.id, m.string) for m in catalog] == [(m.id, m.string) for m in mapped]
+
+    def test_non_utf8_roundtrip(self):
+        catalog = Catalog(locale='de', charset='iso-8859-1')
+        catalog.add('bear', 'Bär')
+        catalog.add(('Bär', 'Bären'), ('Bär', 'Bären'))
+        buf = BytesIO()
+        mofile.write_mo(buf, catalog)
+        assert 'Bär'.encode('iso-8859-1') in buf.getvalue()
+        buf.seek(0)
+        read = mofile.read_mo(buf)
+        assert read.charset == 'iso-8859-1'
+        assert read['bear'].string == 'Bär'
+        assert read['Bär'].string == ['Bär', 'Bären']
+
 
 class WriteMoTestCase(unittest.TestCase):
 
@@ -87,3 +116,19 @@ class WriteMoTestCase(unittest.TestCase):
         translations.add_fallback(Translations(fp=buf2))
 
         assert translations.ugettext('Fuzz') == 'Flou'
+
+    def test_keys_sorted_as_bytes(self):
+        catalog = Catalog(locale='de')
+        catalog.add('zebra', 'Zebra')
+        catalog.add('apple', 'Apfel', context='fruit')
+        catalog.add('apple', 'Apfel')
+        catalog.add(('bear', 'bears'), ('Bär', 'Bären'))
+        buf = BytesIO()
+        mofile.write_mo(buf, catalog)
+        data = buf.getvalue()
+        count, masteridx = struct.unpack('<2I', data[8:16])
+        keys = []
+        for length, offset in struct.iter_unpack('<II', data[masteridx:masteridx + 8 * count]):
+            keys.append(data[offset:offset + length])
+        assert keys == sorted(keys)
+        assert keys[1:] == [b'apple', b'bear\x00bears', b'fruit\x04apple', b'zebra']
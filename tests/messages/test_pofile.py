@@ -76,6 +76,36 @@ msgstr "bär"'''.encode('iso-8859-1'))
         catalog = pofile.read_po(buf, locale='xx_XX')
         assert catalog.charset == 'mac_roman'
 
+    def test_binary_lines_split_on_line_feed_only(self):
+        buf = BytesIO('msgid "foo"\r\nmsgstr "Voh\u2028Bar"\r\n'.encode('utf-8'))
+        catalog = pofile.read_po(buf)
+        assert catalog['foo'].string == 'Voh\u2028Bar'
+
+    def test_read_leaves_stream_open(self):
+        for buf in (BytesIO(b'msgid "foo"\nmsgstr "Voh"\n'),
+                    StringIO('msgid "foo"\nmsgstr "Voh"\n')):
+            catalog = pofile.read_po(buf)
+            assert catalog['foo'].string == 'Voh'
+            assert not buf.closed
+            buf.seek(0)
+            assert buf.readline()[:5] in (b'msgid', 'msgid')
+
+    def test_read_from_iterable_of_lines(self):
+        catalog = pofile.read_po([b'msgid "foo"\n', 'msgstr "Voh"\n'])
+        assert catalog['foo'].string == 'Voh'
+
+    def test_header_charset_applies_to_later_binary_lines(self):
+        buf = BytesIO('''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=iso-8859-1\\n"
+
+msgid "foo"
+msgstr "Bär"
+'''.encode('iso-8859-1'))
+        catalog = pofile.read_po(buf)
+        assert catalog.charset == 'iso-8859-1'
+        assert catalog['foo'].string == 'Bär'
+
     def test_plural_forms_header_parsed(self):
         buf = BytesIO(b'msgid ""\nmsgstr ""\n"Plural-Forms: nplurals=42; plural=(n % 11);\\n"\n')
         catalog = pofile.read_po(buf, locale='xx_XX')
@@ -854,6 +884,17 @@ class PofileFunctionsTestCase(unittest.TestCase):
         # regression test for #198
         assert pofile.unescape(r'"\\n"') == '\\n'
 
+    def test_escape_unescape_roundtrip(self):
+        assert pofile.escape('\t\r\n') == '"\\t\\r\\n"'
+        for string in ('\t', '\r', '\n', 'a\tb\r\nc', '\\t "\\n"'):
+            assert pofile.unescape(pofile.escape(string)) == string
+
+    def test_denormalize_multiline(self):
+        string = 'Say:\n  "Lorem ipsum dolor sit amet, consectetur adipisicing elit, "\n'
+        normalized = pofile.normalize(string, width=32)
+        assert normalized.startswith('""\n')
+        assert pofile.denormalize(normalized) == string
+
     def test_denormalize_on_msgstr_without_empty_first_line(self):
         # handle irregular multi-line msgstr (no "" as first line)
         # gracefully (#171)
@@ -1,4 +1,8 @@
-from babel.languages import get_official_languages, get_territory_language_info
+from babel.languages import (
+    get_official_languages,
+    get_territory_language_arrays,
+    get_territory_language_info,
+)
 
 
 def test_official_languages():
@@ -14,3 +18,11 @@ def test_get_language_info():
         set(get_territory_language_info("HU")) ==
         {"hu", "fr", "en", "de", "ro", "hr", "sk", "sl"}
     )
+
+
+def test_get_language_arrays():
+    codes, population_percents, official_statuses = get_territory_language_arrays("HU")
+    info = get_territory_language_info("HU")
+    assert codes == tuple(info)
+    assert population_percents == tuple(info[code]["population_percent"] for code in codes)
+    assert official_statuses == tuple(info[code].get("official_status") for code in codes)
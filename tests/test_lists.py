@@ -11,6 +11,8 @@ def test_format_list():
         (['string1', 'string2', 'string3'], 'en', 'string1, string2, and string3'),
         (['string1', 'string2', 'string3'], 'zh', 'string1、string2和string3'),
         (['string1', 'string2', 'string3', 'string4'], 'ne', 'string1,string2, string3 र string4'),
+        (['string1', 'string2', 'string3', 'string4', 'string5'], 'en', 'string1, string2, string3, string4, and string5'),
+        (['{0}', '{1}', '{2}'], 'en', '{0}, {1}, and {2}'),
     ]:
         assert lists.format_list(list, locale=locale) == expected
 
@@ -253,6 +253,13 @@ def test_list_currencies():
     assert len(list_currencies()) == 305
 
 
+def test_list_currencies_returns_copy():
+    currencies = list_currencies('fr')
+    currencies.add('FUU')
+    assert 'FUU' not in list_currencies('fr')
+    assert not is_currency('FUU', 'fr')
+
+
 def test_validate_currency():
     validate_currency('EUR')
 
@@ -801,6 +808,11 @@ def test_parse_pattern_negative():
     assert np.prefix == ('¤ ', '¤ ')
     assert np.suffix == ('', '-')
 
+    # Suffix only
+    np = numbers.parse_pattern('#,##0%')
+    assert np.prefix == ('', '-')
+    assert np.suffix == ('%', '%')
+
 
 def test_numberpattern_repr():
     """repr() outputs the pattern string"""
@@ -838,3 +850,43 @@ def test_single_quotes_in_pattern():
     assert numbers.format_decimal(123, "'$'''0", locale='en') == "$'123"
 
     assert numbers.format_decimal(12, "'#'0 o''clock", locale='en') == "#12 o'clock"
+
+
+def test_format_decimal_integers():
+    assert numbers.format_decimal(10 ** 30, '#,##0.###', locale='en_US') == '1,000,000,000,000,000,000,000,000,000,000'
+    assert numbers.format_decimal(-1234567, '#,##0.###', locale='de') == '-1.234.567'
+    assert numbers.format_decimal(1234567, '#,##0.###', locale='en_US', group_separator=False) == '1234567'
+    assert numbers.format_decimal(12, '#,##0.00', locale='en_US') == '12.00'
+
+
+def test_format_decimal_secondary_grouping():
+    assert numbers.format_decimal(12345678, '#,##,##0.##', locale='en_US') == '1,23,45,678'
+    assert numbers.format_decimal(-1234567.5, '#,##,##0.#', locale='en_US') == '-12,34,567.5'
+    assert numbers.format_decimal(123, '#,##,##0.##', locale='en_US') == '123'
+    assert numbers.format_decimal(1234567890, '#,####,###.##', locale='en_US') == '123,4567,890'
+
+
+def test_format_decimal_many():
+    values = [1.2345, 12345.5, -1, '0.5', decimal.Decimal('1099.9876')]
+    for kwargs in ({'locale': 'en_US'}, {'locale': 'sv_SE', 'group_separator': False},
+                   {'format': '#,##0.00', 'locale': 'de'}, {'locale': 'en_US', 'decimal_quantization': False}):
+        assert numbers.format_decimal_many(values, **kwargs) == [numbers.format_decimal(v, **kwargs) for v in values]
+    assert numbers.format_decimal_many([], locale='en_US') == []
+
+
+def test_format_currency_many():
+    values = [1099.98, 1, -5, decimal.Decimal('101299.9876')]
+    for currency, kwargs, expected in (
+        ('USD', {'locale': 'en_US'}, ['$1,099.98', '$1.00', '-$5.00', '$101,299.99']),
+        ('EUR', {'locale': 'de_DE'}, ['1.099,98\xa0€', '1,00\xa0€', '-5,00\xa0€', '101.299,99\xa0€']),
+        ('EUR', {'locale': 'fr_CA', 'group_separator': False}, ['1099,98\xa0€', '1,00\xa0€', '-5,00\xa0€', '101299,99\xa0€']),
+        ('JPY', {'locale': 'ja_JP'}, ['￥1,100', '￥1', '-￥5', '￥101,300']),
+        ('JPY', {'locale': 'en_US', 'currency_digits': False}, ['¥1,099.98', '¥1.00', '-¥5.00', '¥101,299.99']),
+        ('EUR', {'format': '¤¤ #,##0.00', 'locale': 'en_US'}, ['EUR 1,099.98', 'EUR 1.00', '-EUR 5.00', 'EUR 101,299.99']),
+        ('USD', {'locale': 'en_US', 'format_type': 'accounting'}, ['$1,099.98', '$1.00', '($5.00)', '$101,299.99']),
+        ('USD', {'locale': 'en_US', 'format_type': 'name'},
+         ['1,099.98 US dollars', '1.00 US dollar', '-5.00 US dollars', '101,299.99 US dollars']),
+    ):
+        assert numbers.format_currency_many(values, currency, **kwargs) == expected
+    with pytest.raises(numbers.UnknownCurrencyFormatError):
+        numbers.format_currency_many([1], 'EUR', locale='root', format_type='unknown')
@@ -13,6 +13,7 @@
 import __future__
 
 import unittest
+from datetime import datetime, timedelta
 from io import BytesIO
 
 import pytest
@@ -44,6 +45,10 @@ def test_pathmatch():
     assert util.pathmatch('./foo/**.py', 'foo/bar/baz/blah.py')
     assert util.pathmatch('./blah.py', 'blah.py')
     assert not util.pathmatch('./foo/**.py', 'blah/foo/bar/baz.py')
+    assert util.pathmatch('setup.py', 'setup.py')
+    assert not util.pathmatch('setup.py', 'foo/setup.py')
+    assert not util.pathmatch('**.py', '.py')
+    assert not util.pathmatch('**.py', 'foo/.py')
 
 
 class FixedOffsetTimezoneTestCase(unittest.TestCase):
@@ -57,6 +62,13 @@ class FixedOffsetTimezoneTestCase(unittest.TestCase):
     def test_zone_positive_offset(self):
         assert util.FixedOffsetTimezone(330).zone == 'Etc/GMT+330'
 
+    def test_offset(self):
+        tz = util.FixedOffsetTimezone(-90, 'Test')
+        dt = datetime(2007, 4, 1, 15, 30, tzinfo=tz)
+        assert dt.utcoffset() == timedelta(minutes=-90)
+        assert dt.tzname() == 'Test'
+        assert dt.dst() == timedelta(0)
+
 
 def parse_encoding(s):
     return util.parse_encoding(BytesIO(s.encode('utf-8')))
@@ -74,6 +86,11 @@ def test_parse_encoding_non_ascii():
     assert parse_encoding('K\xf6ln') is None
 
 
+def test_parse_encoding_long_first_line():
+    assert parse_encoding(f"x = '{'x' * 1000}'\n# coding: latin-1\n") == 'latin-1'
+    assert parse_encoding(f"# {'x' * 1000} coding: latin-1\nx = 1\n") == 'latin-1'
+
+
 @pytest.mark.parametrize('source, result', [
     ('''
 from __future__ import print_function,